@@ -45,8 +45,12 @@ def main():
     
     # Create necessary directories
     directories = ['uploads', 'vector_store', 'static', 'templates']
+    # One directory listing tells us which already exist; only the missing ones hit mkdir
+    with os.scandir('.') as entries:
+        existing = {entry.name for entry in entries if entry.is_dir()}
     for directory in directories:
-        os.makedirs(directory, exist_ok=True)
+        if directory not in existing:
+            os.makedirs(directory, exist_ok=True)
         logger.info(f"✓ Directory '{directory}' ready")
     
     logger.info("System ready! Starting web server...")
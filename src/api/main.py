@@ -8,6 +8,7 @@ import logging
 import uuid
 import time
 import os
+import shutil
 from typing import Dict, List, Any, Optional
 from pathlib import Path
 import json
@@ -17,6 +18,7 @@ from fastapi.responses import HTMLResponse, JSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from starlette.requests import Request
 from pydantic import BaseModel
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
@@ -152,6 +154,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger JSON responses (summaries, search results, document lists)
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # Global initialization status
 initialization_status = {
     "status": "initializing",
@@ -177,7 +182,8 @@ async def initialize_models_background():
             initialization_status["message"] = "Loading embedding model..."
             initialization_status["progress"] = 25
             logger.info("Initializing AI Model Manager...")
-            ai_models = AIModelManager()
+            # Model loading blocks for a while; keep it off the event loop so requests are still served
+            ai_models = await asyncio.to_thread(AIModelManager)
             logger.info("AI Model Manager initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize AI models: {e}")
@@ -187,7 +193,7 @@ async def initialize_models_background():
             initialization_status["message"] = "Initializing document processor..."
             initialization_status["progress"] = 50
             logger.info("Initializing Document Processor...")
-            document_processor = DocumentProcessor()
+            document_processor = await asyncio.to_thread(DocumentProcessor)
             logger.info("Document Processor initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize document processor: {e}")
@@ -233,6 +239,12 @@ async def initialize_models_background():
         import traceback
         logger.error(f"Full traceback: {traceback.format_exc()}")
 
+def save_upload_file(source, destination) -> None:
+    """Stream an upload's spooled file to destination in 1 MiB chunks"""
+    source.seek(0)
+    with open(destination, "wb") as buffer:
+        shutil.copyfileobj(source, buffer, 1 << 20)
+
 # Startup event - non-blocking
 @app.on_event("startup")
 async def startup_event():
@@ -247,6 +259,12 @@ async def startup_event():
     # Don't await the task - let it run in background
     logger.info("Web server is ready, AI models loading in background...")
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop the document processor's worker processes"""
+    if document_processor is not None:
+        document_processor.close()
+
 # Health check endpoint
 @app.get("/health")
 async def health_check():
@@ -312,9 +330,7 @@ async def upload_document(
         upload_dir.mkdir(exist_ok=True)
         file_path = upload_dir / f"{document_id}_{file.filename}"
         
-        with open(file_path, "wb") as buffer:
-            content = await file.read()
-            buffer.write(content)
+        await asyncio.to_thread(save_upload_file, file.file, file_path)
         
         # Get estimated processing time
         time_estimate = document_processor.estimate_processing_time(str(file_path))
@@ -611,17 +627,11 @@ async def search_documents(
 async def estimate_processing_time(file: UploadFile = File(...)):
     """Estimate processing time for uploaded file"""
     try:
-        # Save file temporarily to get size
-        temp_file = f"temp_{file.filename}"
-        with open(temp_file, "wb") as buffer:
-            content = await file.read()
-            buffer.write(content)
+        # Size the spooled upload in place instead of copying it to a temp file
+        file_size = await asyncio.to_thread(file.file.seek, 0, os.SEEK_END)
         
         # Get estimate
-        estimate = document_processor.estimate_processing_time(temp_file)
-        
-        # Clean up temp file
-        os.remove(temp_file)
+        estimate = document_processor.estimate_processing_time(file.filename, file_size=file_size)
         
         return {
             "filename": file.filename,
@@ -8,6 +8,7 @@ import logging
 import uuid
 import time
 import os
+import shutil
 from typing import Dict, List, Any, Optional
 from pathlib import Path
 import json
@@ -17,6 +18,7 @@ from fastapi.responses import HTMLResponse, JSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from starlette.requests import Request
 from pydantic import BaseModel
 import uvicorn
@@ -26,7 +28,7 @@ import sys
 sys.path.append(str(Path(__file__).parent.parent.parent))
 
 from src.core.document_processor import DocumentProcessor, ProcessedDocument
-from src.core.mongodb_store import MongoDBStore, get_mongodb_store
+from src.core.mongodb_store import MongoDBStore, get_mongodb_store, close_shared_clients
 from src.models.ai_models import AIModelManager, DocumentAnalyzer
 from src.utils.indian_language_detector import IndianLanguageDetector
 
@@ -71,6 +73,9 @@ document_processor: Optional[DocumentProcessor] = None
 user_mongodb_stores: Dict[str, MongoDBStore] = {}
 document_analyzer: Optional[DocumentAnalyzer] = None
 
+# File types accepted by /upload
+SUPPORTED_EXTENSIONS = frozenset({'.pdf', '.docx', '.pptx', '.png', '.jpg', '.jpeg', '.tiff', '.bmp'})
+
 # Setup templates and static files
 templates = Jinja2Templates(directory="templates")
 app.mount("/static", StaticFiles(directory="static"), name="static")
@@ -122,6 +127,9 @@ app.add_middleware(
     expose_headers=["*"]  # Expose all headers
 )
 
+# Compress larger JSON responses (summaries, search results, document lists)
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # Global initialization status
 initialization_status = {
     "status": "initializing",
@@ -164,7 +172,6 @@ async def initialize_models_background():
             logger.info("🤖 Initializing optimized AI Model Manager...")
             
             # Check available disk space and optimize accordingly
-            import shutil
             cache_dir = os.path.expanduser("~/.cache/huggingface")
             if os.path.exists(cache_dir):
                 free_space = shutil.disk_usage(cache_dir).free / (1024**3)  # GB
@@ -177,7 +184,8 @@ async def initialize_models_background():
             # Load models with progress updates
             initialization_status["message"] = "Loading embedding models (1/4)..."
             initialization_status["progress"] = 25
-            ai_models = AIModelManager()
+            # Model loading blocks for a while; keep it off the event loop so requests are still served
+            ai_models = await asyncio.to_thread(AIModelManager)
             logger.info("✅ AI Model Manager initialized with optimizations")
         except Exception as e:
             logger.error(f"Failed to initialize AI models: {e}")
@@ -189,7 +197,7 @@ async def initialize_models_background():
             initialization_status["message"] = "Loading OCR engines (2/4)..."
             initialization_status["progress"] = 50
             logger.info("📝 Initializing Document Processor with Hindi/Kannada OCR...")
-            document_processor = DocumentProcessor()
+            document_processor = await asyncio.to_thread(DocumentProcessor)
             logger.info("✅ Document Processor with multilingual OCR ready")
         except Exception as e:
             logger.error(f"Failed to initialize document processor: {e}")
@@ -236,6 +244,19 @@ async def initialize_models_background():
         import traceback
         logger.error(f"Full traceback: {traceback.format_exc()}")
 
+def save_upload_file(source, destination: Path, max_size: int) -> int:
+    """Copy an upload's spooled file to destination unless it exceeds max_size; return its size"""
+    source.seek(0, os.SEEK_END)
+    size = source.tell()
+    if size > max_size:
+        return size
+    
+    source.seek(0)
+    with open(destination, "wb") as buffer:
+        # Large buffered copies; fileno()/sendfile would force small in-memory uploads to disk
+        shutil.copyfileobj(source, buffer, 1 << 20)
+    return size
+
 # Startup event - non-blocking
 @app.on_event("startup")
 async def startup_event():
@@ -243,12 +264,12 @@ async def startup_event():
     logger.info("Starting PolyDoc AI web server with MongoDB...")
     logger.info("Starting background AI model initialization...")
 
-    # Ensure uploads and static dirs exist
-    for d in ["uploads", "static", "templates"]:
-        try:
-            os.makedirs(d, exist_ok=True)
-        except Exception:
-            pass
+    # Ensure uploads and static dirs exist (mkdirs run concurrently off the event loop)
+    await asyncio.gather(
+        *[asyncio.to_thread(Path(d).mkdir, parents=True, exist_ok=True)
+          for d in ["uploads", "static", "templates"]],
+        return_exceptions=True
+    )
     
     # Start model initialization in background
     asyncio.create_task(initialize_models_background())
@@ -256,6 +277,15 @@ async def startup_event():
     # Don't await the task - let it run in background
     logger.info("Web server is ready, AI models and MongoDB loading in background...")
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release the shared MongoDB connection pool and document worker processes"""
+    if document_processor is not None:
+        document_processor.close()
+    user_mongodb_stores.clear()
+    await close_shared_clients()
+    logger.info("MongoDB connections closed")
+
 # Add explicit OPTIONS handler for all routes
 @app.options("/{full_path:path}")
 async def options_handler(full_path: str):
@@ -316,21 +346,12 @@ async def upload_document(
             raise HTTPException(status_code=400, detail="No file provided")
         
         # Validate file type
-        supported_extensions = {'.pdf', '.docx', '.pptx', '.png', '.jpg', '.jpeg', '.tiff', '.bmp'}
-        file_extension = Path(file.filename).suffix.lower()
+        file_extension = os.path.splitext(file.filename)[1].lower()
         
-        if file_extension not in supported_extensions:
+        if file_extension not in SUPPORTED_EXTENSIONS:
             raise HTTPException(
                 status_code=400, 
-                detail=f"Unsupported file type: {file_extension}. Supported types: {', '.join(sorted(supported_extensions))}"
-            )
-        
-        # Validate file size (10MB limit)
-        file_content = await file.read()
-        if len(file_content) > 10 * 1024 * 1024:  # 10MB
-            raise HTTPException(
-                status_code=400,
-                detail="File size must be less than 10MB"
+                detail=f"Unsupported file type: {file_extension}. Supported types: {', '.join(sorted(SUPPORTED_EXTENSIONS))}"
             )
         
         # Create unique document ID
@@ -341,8 +362,15 @@ async def upload_document(
         upload_dir.mkdir(exist_ok=True)
         file_path = upload_dir / f"{document_id}_{file.filename}"
         
-        with open(file_path, "wb") as buffer:
-            buffer.write(file_content)  # Use already read content
+        # Copy the spooled upload to disk in one worker thread, validating file size (10MB limit) first
+        max_file_size = 10 * 1024 * 1024  # 10MB
+        total_size = await asyncio.to_thread(save_upload_file, file.file, file_path, max_file_size)
+        
+        if total_size > max_file_size:
+            raise HTTPException(
+                status_code=400,
+                detail="File size must be less than 10MB"
+            )
         
         # Get estimated processing time
         time_estimate = document_processor.estimate_processing_time(str(file_path))
@@ -707,13 +735,16 @@ async def get_system_statistics():
         if user_mongodb_stores:
             total_docs = 0
             total_chunks = 0
-            for user_store in user_mongodb_stores.values():
-                try:
-                    user_stats = await user_store.get_statistics()
-                    total_docs += user_stats.get('total_documents', 0)
-                    total_chunks += user_stats.get('total_chunks', 0)
-                except Exception:
+            # Each user has an independent database, so query them concurrently
+            all_user_stats = await asyncio.gather(
+                *[user_store.get_statistics() for user_store in user_mongodb_stores.values()],
+                return_exceptions=True
+            )
+            for user_stats in all_user_stats:
+                if isinstance(user_stats, Exception):
                     continue
+                total_docs += user_stats.get('total_documents', 0)
+                total_chunks += user_stats.get('total_chunks', 0)
             stats["mongodb"] = {
                 "total_documents": total_docs,
                 "total_chunks": total_chunks,
@@ -4,18 +4,30 @@ Handles PDF, DOCX, PPTX, and image files with layout preservation
 """
 
 import os
+import io
+import re
+import posixpath
+import zipfile
 import asyncio
+import atexit
+import functools
+import importlib.util
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
 from pathlib import Path
 import logging
+from collections import Counter
 
 # Document processing imports
 import PyPDF2
 from docx import Document as DocxDocument
+from docx.oxml.ns import qn
 from pptx import Presentation
+from lxml import etree
 from PIL import Image
-import cv2
 import numpy as np
 import pandas as pd
 import json
@@ -24,9 +36,39 @@ from bs4 import BeautifulSoup
 import markdown
 import chardet
 
-# OCR imports
+# OCR imports (EasyOCR and OpenCV are imported on first image to keep startup light)
 import pytesseract
-import easyocr
+
+# Persistent Tesseract API handles (optional, avoids per-call tesseract process startup)
+try:
+    from tesserocr import PyTessBaseAPI, RIL, iterate_level
+    TESSEROCR_AVAILABLE = True
+except ImportError:
+    TESSEROCR_AVAILABLE = False
+
+# Native PDF text extraction (optional, PyPDF2 is the fallback)
+try:
+    import pypdfium2 as pdfium
+    PDFIUM_AVAILABLE = True
+except ImportError:
+    pdfium = None
+    PDFIUM_AVAILABLE = False
+
+# fastText language identification (optional, fast path for _detect_language)
+try:
+    from fast_langdetect import detect as fast_langdetect
+    FAST_LANGDETECT_AVAILABLE = True
+except ImportError:
+    fast_langdetect = None
+    FAST_LANGDETECT_AVAILABLE = False
+
+# Native JSON parser (optional, stdlib json is the fallback)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
 
 # Additional imports for new formats
 try:
@@ -43,13 +85,160 @@ try:
 except ImportError:
     ODT_AVAILABLE = False
 
-# Layout analysis (optional)
-try:
-    import layoutparser as lp
-    LAYOUT_PARSER_AVAILABLE = True
-except ImportError:
-    lp = None
-    LAYOUT_PARSER_AVAILABLE = False
+# Layout analysis (optional; probed without importing, since it pulls in Detectron2/torch)
+LAYOUT_PARSER_AVAILABLE = importlib.util.find_spec('layoutparser') is not None
+
+# PDFium is not thread-safe; serialize calls made from threads of the same process
+_PDFIUM_LOCK = threading.Lock()
+
+def _count_pdf_pages(file_path: str, use_pdfium: bool) -> int:
+    """Return the number of pages in a PDF"""
+    if use_pdfium:
+        with _PDFIUM_LOCK:
+            pdf = pdfium.PdfDocument(file_path)
+            try:
+                return len(pdf)
+            finally:
+                pdf.close()
+    with open(file_path, 'rb') as file:
+        return len(PyPDF2.PdfReader(file).pages)
+
+def _extract_pdf_page_range(file_path: str, start: int, stop: int, use_pdfium: bool) -> List[str]:
+    """Extract text for pages [start, stop) of a PDF (module-level so worker processes can run it)"""
+    if use_pdfium:
+        with _PDFIUM_LOCK:
+            pdf = pdfium.PdfDocument(file_path)
+            try:
+                page_texts = []
+                for index in range(start, stop):
+                    page = pdf[index]
+                    text_page = page.get_textpage()
+                    try:
+                        # PDFium separates lines with CRLF; normalize for paragraph splitting
+                        page_texts.append(text_page.get_text_range().replace('\r\n', '\n'))
+                    finally:
+                        text_page.close()
+                        page.close()
+                return page_texts
+            finally:
+                pdf.close()
+    with open(file_path, 'rb') as file:
+        pdf_reader = PyPDF2.PdfReader(file)
+        return [pdf_reader.pages[index].extract_text() or '' for index in range(start, stop)]
+
+# OOXML namespaces used when reading PPTX parts directly
+_PPTX_NS = {
+    'a': 'http://schemas.openxmlformats.org/drawingml/2006/main',
+    'p': 'http://schemas.openxmlformats.org/presentationml/2006/main',
+    'c': 'http://schemas.openxmlformats.org/drawingml/2006/chart',
+    'r': 'http://schemas.openxmlformats.org/officeDocument/2006/relationships',
+    'rel': 'http://schemas.openxmlformats.org/package/2006/relationships',
+    'dc': 'http://purl.org/dc/elements/1.1/',
+    'dcterms': 'http://purl.org/dc/terms/',
+}
+_PPTX_SLIDE_PART = re.compile(r'ppt/slides/slide(\d+)\.xml$')
+
+def _pptx_part_rels(archive: zipfile.ZipFile, part_name: str) -> Dict[str, Tuple[str, str]]:
+    """Map relationship ids of a PPTX part to (relationship type, resolved part name)"""
+    folder, _, base = part_name.rpartition('/')
+    try:
+        rels_root = etree.fromstring(archive.read(f"{folder}/_rels/{base}.rels"))
+    except KeyError:
+        return {}
+    rels = {}
+    for rel in rels_root.iterfind('rel:Relationship', _PPTX_NS):
+        if rel.get('TargetMode') == 'External':
+            continue
+        target = rel.get('Target', '')
+        target = target.lstrip('/') if target.startswith('/') else posixpath.normpath(posixpath.join(folder, target))
+        rels[rel.get('Id')] = (rel.get('Type', ''), target)
+    return rels
+
+def _pptx_slide_parts(archive: zipfile.ZipFile) -> List[str]:
+    """Return slide part names in presentation order"""
+    try:
+        presentation = etree.fromstring(archive.read('ppt/presentation.xml'))
+        rels = _pptx_part_rels(archive, 'ppt/presentation.xml')
+        slide_parts = [
+            rels[rid][1] for rid in presentation.xpath('p:sldIdLst/p:sldId/@r:id', namespaces=_PPTX_NS)
+            if rid in rels
+        ]
+        if slide_parts:
+            return slide_parts
+    except (KeyError, etree.XMLSyntaxError):
+        pass
+    # No usable slide list: fall back to numeric order of the slide parts
+    return sorted(
+        (name for name in archive.namelist() if _PPTX_SLIDE_PART.match(name)),
+        key=lambda name: int(_PPTX_SLIDE_PART.match(name).group(1))
+    )
+
+_PPTX_BREAK_TAG = f"{{{_PPTX_NS['a']}}}br"
+
+def _pptx_text(text_body) -> str:
+    """Join the runs of each paragraph under a txBody, one line per paragraph (a:br becomes \\v, as in python-pptx)"""
+    if text_body is None:
+        return ''
+    return '\n'.join(
+        ''.join(
+            '\v' if node.tag == _PPTX_BREAK_TAG else (node.text or '')
+            for node in paragraph.xpath('a:r/a:t | a:fld/a:t | a:br', namespaces=_PPTX_NS)
+        )
+        for paragraph in text_body.iterfind('a:p', _PPTX_NS)
+    )
+
+def _pptx_bbox(shape) -> Tuple[int, int, int, int]:
+    """Bounding box (EMU) from a shape's own transform; (0, 0, 0, 0) when it is inherited"""
+    xfrm = shape.find('p:spPr/a:xfrm', _PPTX_NS)
+    if xfrm is None:
+        xfrm = shape.find('p:xfrm', _PPTX_NS)
+    off = xfrm.find('a:off', _PPTX_NS) if xfrm is not None else None
+    ext = xfrm.find('a:ext', _PPTX_NS) if xfrm is not None else None
+    if off is None or ext is None:
+        return (0, 0, 0, 0)
+    left, top = int(off.get('x', 0)), int(off.get('y', 0))
+    return (left, top, left + int(ext.get('cx', 0)), top + int(ext.get('cy', 0)))
+
+# EasyOCR readers shared by every DocumentProcessor in this process, keyed by (languages, gpu)
+_EASYOCR_READERS: Dict[Tuple[Tuple[str, ...], bool], Any] = {}
+_EASYOCR_READERS_LOCK = threading.Lock()
+
+def _get_easyocr_reader(languages: List[str], gpu: bool):
+    """Return the process-wide EasyOCR reader for a language group, loading weights only once"""
+    key = (tuple(languages), gpu)
+    with _EASYOCR_READERS_LOCK:
+        reader = _EASYOCR_READERS.get(key)
+        if reader is None:
+            import easyocr
+            # Use more conservative settings to avoid memory issues
+            reader = easyocr.Reader(
+                languages, 
+                gpu=gpu,
+                quantize=True,  # int8 recognizer on CPU: faster and smaller
+                # DBNet is the faster detector but its deformable conv needs CUDA
+                detect_network='dbnet18' if gpu else 'craft',
+                cudnn_benchmark=gpu,
+                verbose=False,  # Reduce logging
+                download_enabled=True  # Allow downloading if needed
+            )
+            _EASYOCR_READERS[key] = reader
+        return reader
+
+# Preprocessed variants per EasyOCR forward pass; full-resolution scans make larger batches risk OOM
+_EASYOCR_BATCH_SIZE = 2
+
+# EasyOCR reader owned by an OCR worker process (see DocumentProcessor._start_ocr_pool)
+_WORKER_OCR_READER = None
+
+def _init_ocr_worker(languages: List[str], gpu: bool):
+    """Pool initializer: load one EasyOCR reader per worker process"""
+    global _WORKER_OCR_READER
+    import easyocr
+    _WORKER_OCR_READER = easyocr.Reader(languages, gpu=gpu, quantize=True, verbose=False)
+
+def _ocr_worker_readtext_batched(images: List[np.ndarray]) -> List[List[Any]]:
+    """Run batched EasyOCR inside a worker process"""
+    return _WORKER_OCR_READER.readtext_batched(images, batch_size=_EASYOCR_BATCH_SIZE)
 
 @dataclass
 class DocumentElement:
@@ -62,6 +251,17 @@ class DocumentElement:
     language: Optional[str] = None
     font_info: Optional[Dict] = None
 
+@dataclass
+class DocumentColumns:
+    """Struct-of-arrays view of a document's elements for vectorized passes"""
+    texts: List[str]
+    languages: List[Optional[str]]
+    bboxes: Optional[np.ndarray]  # (N, 4) float32, None when not requested
+    confidences: np.ndarray  # (N,) float64, so reductions match plain Python floats
+    page_numbers: np.ndarray  # (N,) int32
+    type_ids: np.ndarray  # (N,) int8, indexes into type_names
+    type_names: Tuple[str, ...]
+
 @dataclass
 class ProcessedDocument:
     """Container for processed document information"""
@@ -70,18 +270,125 @@ class ProcessedDocument:
     elements: List[DocumentElement]
     summary: Optional[str] = None
     metadata: Dict[str, Any] = None
+    
+    def to_columns(self, include_bboxes: bool = True) -> DocumentColumns:
+        """Build contiguous per-field arrays from the element list in one pass each"""
+        elements = self.elements
+        count = len(elements)
+        type_index: Dict[str, int] = {}
+        type_ids = np.fromiter(
+            (type_index.setdefault(element.element_type, len(type_index)) for element in elements),
+            dtype=np.int8, count=count
+        )
+        return DocumentColumns(
+            texts=[element.text for element in elements],
+            languages=[element.language for element in elements],
+            bboxes=np.array([element.bbox for element in elements], dtype=np.float32).reshape(count, 4) if include_bboxes else None,
+            confidences=np.fromiter((element.confidence for element in elements), dtype=np.float64, count=count),
+            page_numbers=np.fromiter((element.page_number for element in elements), dtype=np.int32, count=count),
+            type_ids=type_ids,
+            type_names=tuple(type_index)
+        )
 
 class DocumentProcessor:
     """Main document processor supporting multiple formats"""
     
+    # PDFs with fewer pages are extracted in a single worker thread
+    _PDF_PARALLEL_MIN_PAGES = 16
+    
+    # Upper bound on PDF extraction worker processes
+    _PDF_MAX_WORKERS = 4
+    
+    # Below this many pixels, CPU Tesseract outperforms EasyOCR
+    _SMALL_IMAGE_PIXELS = 1_000_000
+    
+    # Unicode script ranges for fallback language detection, in priority order
+    _SCRIPT_RANGES = (
+        ('kn', 0x0C80, 0x0CFF),  # Kannada
+        ('te', 0x0C00, 0x0C7F),  # Telugu
+        ('ta', 0x0B80, 0x0BFF),  # Tamil
+        ('hi', 0x0900, 0x097F),  # Devanagari (Hindi, Marathi, etc.; default to Hindi)
+        ('bn', 0x0980, 0x09FF),  # Bengali
+        ('gu', 0x0A80, 0x0AFF),  # Gujarati
+        ('ml', 0x0D00, 0x0D7F),  # Malayalam
+        ('pa', 0x0A00, 0x0A7F),  # Punjabi (Gurmukhi)
+        ('ar', 0x0600, 0x06FF),  # Arabic
+    )
+    
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         
-        # Initialize EasyOCR with smart language selection and memory optimization
-        # EasyOCR has compatibility restrictions between certain language combinations
+        # OCR engines and layout model are loaded on first image (see _ensure_ocr_engines)
         self.ocr_readers = {}
         self.primary_ocr_reader = None
+        self.ocr_reader = None
         self.use_tesseract_fallback = False
+        self.ocr_gpu = False  # Force CPU to avoid GPU issues
+        self.layout_model = None
+        self._ocr_engines_loaded = False
+        self._primary_ocr_languages: Optional[List[str]] = None
+        
+        # Optional EasyOCR process pool; PyTorch inference doesn't parallelize across threads
+        self.ocr_workers = int(os.getenv('POLYDOC_EASYOCR_WORKERS', '0'))
+        self._ocr_pool = None
+        
+        # tesserocr handles per language string, created once and reused (not thread-safe)
+        self._tesseract_apis: Dict[str, Any] = {}
+        self._tesseract_lock = threading.Lock()
+        
+        # Process pool for page-parallel PDF extraction (created on first large PDF)
+        self._pdf_pool: Optional[ProcessPoolExecutor] = None
+        
+        # Per-instance language detection cache (a class-level lru_cache would pin every processor)
+        self._detect_normalized_language = functools.lru_cache(maxsize=4096)(self._detect_normalized_language_uncached)
+        
+        # Processor per file extension; image formats fall through to _process_image
+        self._format_processors = {
+            '.pdf': self._process_pdf,
+            '.docx': self._process_docx,
+            '.ppt': self._process_ppt,
+            '.pptx': self._process_pptx,
+            '.txt': self._process_text,
+            '.rtf': self._process_text,
+            '.md': self._process_markdown,
+            '.markdown': self._process_markdown,
+            '.csv': self._process_spreadsheet,
+            '.xlsx': self._process_spreadsheet,
+            '.xls': self._process_spreadsheet,
+            '.json': self._process_json,
+            '.xml': self._process_xml,
+            '.html': self._process_html,
+            '.htm': self._process_html,
+            '.odt': self._process_odt,
+        }
+        
+        # Supported file types (expanded)
+        self.supported_formats = {
+            # Original formats
+            '.pdf', '.docx', '.ppt', '.pptx', '.png', '.jpg', '.jpeg', '.tiff', '.bmp',
+            # New text formats
+            '.txt', '.rtf', '.md', '.markdown',
+            # Spreadsheet formats
+            '.csv', '.xlsx', '.xls',
+            # Structured data formats
+            '.json', '.xml', '.html', '.htm',
+            # OpenDocument formats
+            '.odt'
+        }
+    
+    def _ensure_ocr_engines(self):
+        """Load OCR readers and the layout model the first time an image is processed"""
+        if self._ocr_engines_loaded:
+            return
+        self._ocr_engines_loaded = True
+        
+        # Initialize EasyOCR with smart language selection and memory optimization
+        # EasyOCR has compatibility restrictions between certain language combinations
+        try:
+            import easyocr
+        except ImportError as e:
+            self.logger.warning(f"EasyOCR not available: {e}")
+            easyocr = None
         
         # Define compatible language groups for EasyOCR (starting with most important)
         # Note: Some languages may not be compatible together, so we test individual pairs
@@ -95,22 +402,17 @@ class DocumentProcessor:
         
         # Try to initialize OCR readers for each compatible group with better error handling
         initialized_count = 0
-        for i, languages in enumerate(compatible_groups):
+        for i, languages in enumerate(compatible_groups if easyocr else []):
             try:
                 self.logger.info(f"Attempting to initialize OCR with languages: {languages}")
-                # Use more conservative settings to avoid memory issues
-                reader = easyocr.Reader(
-                    languages, 
-                    gpu=False,  # Force CPU to avoid GPU issues
-                    verbose=False,  # Reduce logging
-                    download_enabled=True  # Allow downloading if needed
-                )
+                reader = _get_easyocr_reader(languages, self.ocr_gpu)
                 group_key = '+'.join(languages)
                 self.ocr_readers[group_key] = reader
                 
                 # Set the first successful reader as primary
                 if self.primary_ocr_reader is None:
                     self.primary_ocr_reader = reader
+                    self._primary_ocr_languages = languages
                     self.logger.info(f"✅ Primary OCR initialized with: {languages}")
                 else:
                     self.logger.info(f"✅ Additional OCR reader initialized: {languages}")
@@ -155,10 +457,13 @@ class DocumentProcessor:
         # For backward compatibility, set the main ocr_reader attribute
         self.ocr_reader = self.primary_ocr_reader
         
+        if self.ocr_workers > 0 and self.primary_ocr_reader and not self.use_tesseract_fallback:
+            self._start_ocr_pool()
+        
         # Initialize layout model if layoutparser is available
-        self.layout_model = None
         if LAYOUT_PARSER_AVAILABLE:
             try:
+                import layoutparser as lp
                 self.layout_model = lp.Detectron2LayoutModel(
                     'lp://PubLayNet/faster_rcnn_R_50_FPN_3x/config',
                     extra_config=["MODEL.ROI_HEADS.SCORE_THRESH_TEST", 0.8],
@@ -169,20 +474,30 @@ class DocumentProcessor:
                 self.layout_model = None
         else:
             self.logger.info("Layout parser not available, skipping layout model initialization")
-        
-        # Supported file types (expanded)
-        self.supported_formats = {
-            # Original formats
-            '.pdf', '.docx', '.ppt', '.pptx', '.png', '.jpg', '.jpeg', '.tiff', '.bmp',
-            # New text formats
-            '.txt', '.rtf', '.md', '.markdown',
-            # Spreadsheet formats
-            '.csv', '.xlsx', '.xls',
-            # Structured data formats
-            '.json', '.xml', '.html', '.htm',
-            # OpenDocument formats
-            '.odt'
-        }
+    
+    def _start_ocr_pool(self):
+        """Spawn worker processes that each hold a preloaded primary EasyOCR reader"""
+        try:
+            ctx = multiprocessing.get_context('spawn')  # Fork is unsafe once torch has threads
+            self._ocr_pool = ctx.Pool(
+                self.ocr_workers,
+                initializer=_init_ocr_worker,
+                initargs=(self._primary_ocr_languages, self.ocr_gpu)
+            )
+            atexit.register(self._ocr_pool.terminate)
+            self.logger.info(f"✅ Started {self.ocr_workers} EasyOCR worker processes")
+        except Exception as e:
+            self.logger.warning(f"Could not start EasyOCR workers, using in-process OCR: {e}")
+            self._ocr_pool = None
+    
+    def close(self):
+        """Shut down the PDF and OCR worker processes owned by this processor"""
+        if self._pdf_pool is not None:
+            self._pdf_pool.shutdown(wait=False, cancel_futures=True)
+            self._pdf_pool = None
+        if self._ocr_pool is not None:
+            self._ocr_pool.terminate()
+            self._ocr_pool = None
     
     def _get_best_ocr_reader(self, detected_language: str = None):
         """Get the best OCR reader for the detected language"""
@@ -197,11 +512,13 @@ class DocumentProcessor:
         # If no specific reader found, return primary
         return self.primary_ocr_reader
     
-    def estimate_processing_time(self, file_path: str) -> dict:
-        """Estimate processing time based on file size and type"""
+    def estimate_processing_time(self, file_path: str, file_size: Optional[int] = None) -> dict:
+        """Estimate processing time based on file size and type (file_size in bytes skips the stat)"""
         try:
             file_path = Path(file_path)
-            file_size_mb = file_path.stat().st_size / (1024 * 1024)  # Size in MB
+            if file_size is None:
+                file_size = file_path.stat().st_size
+            file_size_mb = file_size / (1024 * 1024)  # Size in MB
             file_ext = file_path.suffix.lower()
             
             # Base processing times (seconds per MB)
@@ -243,38 +560,15 @@ class DocumentProcessor:
             if not file_path.exists():
                 raise FileNotFoundError(f"File not found: {file_path}")
             
-            if file_path.suffix.lower() not in self.supported_formats:
+            file_ext = file_path.suffix.lower()
+            if file_ext not in self.supported_formats:
                 raise ValueError(f"Unsupported format: {file_path.suffix}")
             
             self.logger.info(f"Processing document: {file_path.name}")
             
-            # Route to appropriate processor
-            file_ext = file_path.suffix.lower()
-            
-            if file_ext == '.pdf':
-                return await self._process_pdf(file_path)
-            elif file_ext == '.docx':
-                return await self._process_docx(file_path)
-            elif file_ext == '.ppt':
-                return await self._process_ppt(file_path)
-            elif file_ext == '.pptx':
-                return await self._process_pptx(file_path)
-            elif file_ext in {'.txt', '.rtf'}:
-                return await self._process_text(file_path)
-            elif file_ext in {'.md', '.markdown'}:
-                return await self._process_markdown(file_path)
-            elif file_ext in {'.csv', '.xlsx', '.xls'}:
-                return await self._process_spreadsheet(file_path)
-            elif file_ext == '.json':
-                return await self._process_json(file_path)
-            elif file_ext == '.xml':
-                return await self._process_xml(file_path)
-            elif file_ext in {'.html', '.htm'}:
-                return await self._process_html(file_path)
-            elif file_ext == '.odt':
-                return await self._process_odt(file_path)
-            else:  # Image formats
-                return await self._process_image(file_path)
+            # Route to appropriate processor (anything not listed is an image format)
+            processor = self._format_processors.get(file_ext, self._process_image)
+            return await processor(file_path)
         
         except Exception as e:
             self.logger.error(f"Error processing document: {e}")
@@ -284,31 +578,34 @@ class DocumentProcessor:
         """Process PDF files with layout preservation"""
         elements = []
         
-        with open(file_path, 'rb') as file:
-            pdf_reader = PyPDF2.PdfReader(file)
-            total_pages = len(pdf_reader.pages)
-            
-            for page_num, page in enumerate(pdf_reader.pages, 1):
-                # Extract text
-                text_content = page.extract_text()
-                
-                if text_content.strip():
-                    # For PDFs, we'll treat the extracted text as paragraphs
-                    paragraphs = [p.strip() for p in text_content.split('\n\n') if p.strip()]
-                    
-                    for i, paragraph in enumerate(paragraphs):
-                        element = DocumentElement(
-                            text=paragraph,
-                            page_number=page_num,
-                            element_type='paragraph',
-                            bbox=(0, i*50, 500, (i+1)*50),  # Approximate positioning
-                            confidence=0.9,
-                            language=self._detect_language(paragraph)
-                        )
-                        elements.append(element)
+        page_texts = None
+        if PDFIUM_AVAILABLE:
+            try:
+                page_texts = await self._extract_pdf_pages(file_path, use_pdfium=True)
+            except Exception as e:
+                self.logger.warning(f"pypdfium2 extraction failed, falling back to PyPDF2: {e}")
+        if page_texts is None:
+            page_texts = await self._extract_pdf_pages(file_path, use_pdfium=False)
+        total_pages = len(page_texts)
+        
+        for page_num, text_content in enumerate(page_texts, 1):
+            if text_content.strip():
+                # For PDFs, we'll treat the extracted text as paragraphs
+                paragraphs = [p.strip() for p in text_content.split('\n\n') if p.strip()]
                 
-                # Convert PDF page to image for layout analysis if needed
-                # This would require pdf2image library for more advanced layout detection
+                for i, paragraph in enumerate(paragraphs):
+                    element = DocumentElement(
+                        text=paragraph,
+                        page_number=page_num,
+                        element_type='paragraph',
+                        bbox=(0, i*50, 500, (i+1)*50),  # Approximate positioning
+                        confidence=0.9,
+                        language=self._detect_language(paragraph)
+                    )
+                    elements.append(element)
+            
+            # Convert PDF page to image for layout analysis if needed
+            # This would require pdf2image library for more advanced layout detection
         
         return ProcessedDocument(
             filename=file_path.name,
@@ -317,6 +614,34 @@ class DocumentProcessor:
             metadata={'file_type': 'pdf', 'size': file_path.stat().st_size}
         )
     
+    async def _extract_pdf_pages(self, file_path: Path, use_pdfium: bool) -> List[str]:
+        """Extract per-page text off the event loop, splitting large PDFs across processes"""
+        path = str(file_path)
+        total_pages = await asyncio.to_thread(_count_pdf_pages, path, use_pdfium)
+        workers = min(os.cpu_count() or 1, self._PDF_MAX_WORKERS)
+        
+        if total_pages < self._PDF_PARALLEL_MIN_PAGES or workers == 1:
+            return await asyncio.to_thread(_extract_pdf_page_range, path, 0, total_pages, use_pdfium)
+        
+        if self._pdf_pool is None:
+            self._pdf_pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context('spawn')  # Fork is unsafe once torch has threads
+            )
+            atexit.register(self._pdf_pool.shutdown, wait=False, cancel_futures=True)
+        
+        # Contiguous page ranges, one per worker; gather keeps them in page order
+        pages_per_worker = -(-total_pages // workers)
+        loop = asyncio.get_running_loop()
+        page_chunks = await asyncio.gather(*[
+            loop.run_in_executor(
+                self._pdf_pool, _extract_pdf_page_range, path,
+                start, min(start + pages_per_worker, total_pages), use_pdfium
+            )
+            for start in range(0, total_pages, pages_per_worker)
+        ])
+        return [text for chunk in page_chunks for text in chunk]
+    
     async def _process_docx(self, file_path: Path) -> ProcessedDocument:
         """Process DOCX files with enhanced content extraction"""
         try:
@@ -324,18 +649,27 @@ class DocumentProcessor:
             elements = []
             page_number = 1
             
-            self.logger.info(f"Processing DOCX with {len(doc.paragraphs)} paragraphs and {len(doc.tables)} tables")
+            # Read body paragraphs straight from the XML tree; the python-docx
+            # Paragraph/Style objects re-walk it on every .text/.style access
+            body_paragraphs = doc.element.body.findall(qn('w:p'))
+            style_names = {style.style_id: style.name for style in doc.styles}
+            
+            self.logger.info(f"Processing DOCX with {len(body_paragraphs)} paragraphs and {len(doc.tables)} tables")
             
             # Process paragraphs with better error handling
-            for para_idx, paragraph in enumerate(doc.paragraphs):
-                if paragraph.text and paragraph.text.strip():
+            for para_idx, p_element in enumerate(body_paragraphs):
+                # CT_P.text is exactly Paragraph.text (tabs/breaks mapped, runs and hyperlinks only)
+                paragraph_text = p_element.text
+                if paragraph_text and paragraph_text.strip():
                     try:
                         # Determine element type based on style
-                        style_name = paragraph.style.name if paragraph.style else 'Normal'
+                        style_ids = p_element.xpath('./w:pPr/w:pStyle/@w:val')
+                        # Styles without a <w:name> report None, so fall back to 'Normal'
+                        style_name = (style_names.get(style_ids[0], style_ids[0]) if style_ids else None) or 'Normal'
                         element_type = 'heading' if 'heading' in style_name.lower() else 'paragraph'
                         
                         # Clean and normalize text
-                        cleaned_text = paragraph.text.strip().replace('\r\n', '\n').replace('\r', '\n')
+                        cleaned_text = paragraph_text.strip().replace('\r\n', '\n').replace('\r', '\n')
                         
                         if len(cleaned_text) > 5:  # Only add meaningful content
                             element = DocumentElement(
@@ -556,6 +890,144 @@ class DocumentProcessor:
             )
     
     async def _process_pptx(self, file_path: Path) -> ProcessedDocument:
+        """PowerPoint processing that reads the slide XML directly, falling back to python-pptx"""
+        try:
+            return await self._process_pptx_xml(file_path)
+        except Exception as xml_error:
+            self.logger.warning(f"Direct PPTX XML parsing failed: {xml_error}, falling back to python-pptx")
+            return await self._process_pptx_with_python_pptx(file_path)
+    
+    async def _process_pptx_xml(self, file_path: Path) -> ProcessedDocument:
+        """Extract PowerPoint content by parsing ppt/slides/slideN.xml without the python-pptx object model"""
+        ns = _PPTX_NS
+        elements = []
+        
+        with zipfile.ZipFile(file_path) as archive:
+            slide_parts = _pptx_slide_parts(archive)
+            if not slide_parts:
+                raise ValueError("no slide parts found")
+            
+            self.logger.info(f"Processing PowerPoint with {len(slide_parts)} slides")
+            
+            for slide_num, slide_part in enumerate(slide_parts, 1):
+                slide_root = etree.fromstring(archive.read(slide_part))
+                slide_rels = _pptx_part_rels(archive, slide_part)
+                shapes = slide_root.find('p:cSld/p:spTree', ns)
+                shapes = list(shapes) if shapes is not None else []
+                
+                # First text shape is often the title
+                shape_texts = {}
+                for shape in shapes:
+                    if shape.tag == f"{{{ns['p']}}}sp":
+                        shape_texts[shape] = _pptx_text(shape.find('p:txBody', ns)).strip()
+                slide_title = next((text for text in shape_texts.values() if text), None)
+                if slide_title:
+                    elements.append(DocumentElement(
+                        text=slide_title,
+                        page_number=slide_num,
+                        element_type='heading',
+                        bbox=(0, 0, 500, 50),
+                        confidence=1.0,
+                        language=self._detect_language(slide_title),
+                        font_info={'type': 'slide_title', 'slide_number': slide_num}
+                    ))
+                
+                for shape_idx, shape in enumerate(shapes):
+                    try:
+                        # Handle text shapes
+                        if shape_texts.get(shape):
+                            text = shape_texts[shape]
+                            elements.append(DocumentElement(
+                                text=text,
+                                page_number=slide_num,
+                                element_type=self._determine_pptx_element_type(text, slide_title),
+                                bbox=_pptx_bbox(shape),
+                                confidence=1.0,
+                                language=self._detect_language(text),
+                                font_info={'shape_type': 'text', 'has_text_frame': True}
+                            ))
+                        
+                        # Handle tables
+                        elif shape.find('.//a:tbl', ns) is not None:
+                            rows = [
+                                [_pptx_text(cell.find('a:txBody', ns)).strip() for cell in row.iterfind('a:tc', ns)]
+                                for row in shape.iterfind('.//a:tbl/a:tr', ns)
+                            ]
+                            elements.extend(self._extract_pptx_table(rows, slide_num))
+                        
+                        # Handle charts (title from the chart part, if any)
+                        elif shape.find('.//c:chart', ns) is not None:
+                            chart_title = None
+                            chart_rid = shape.find('.//c:chart', ns).get(f"{{{ns['r']}}}id")
+                            if chart_rid in slide_rels:
+                                chart_root = etree.fromstring(archive.read(slide_rels[chart_rid][1]))
+                                chart_title = ''.join(chart_root.xpath('.//c:title//a:t/text()', namespaces=ns)).strip()
+                            chart_info = self._extract_pptx_chart_info(chart_title or 'Untitled Chart', slide_num)
+                            if chart_info:
+                                elements.append(chart_info)
+                        
+                        # Handle images
+                        elif shape.tag == f"{{{ns['p']}}}pic":
+                            image_element = await self._extract_pptx_image_text(shape, slide_num, file_path)
+                            if image_element:
+                                elements.append(image_element)
+                    
+                    except Exception as shape_error:
+                        self.logger.warning(f"Error processing shape {shape_idx} in slide {slide_num}: {shape_error}")
+                        continue
+                
+                # Extract slide notes from the body placeholder of the linked notes slide
+                notes_part = next(
+                    (target for rel_type, target in slide_rels.values() if rel_type.endswith('/notesSlide')), None
+                )
+                if notes_part:
+                    notes_root = etree.fromstring(archive.read(notes_part))
+                    notes_body = notes_root.xpath(
+                        'p:cSld/p:spTree/p:sp[p:nvSpPr/p:nvPr/p:ph[@type="body"]]/p:txBody', namespaces=ns
+                    )
+                    notes_text = _pptx_text(notes_body[0]).strip() if notes_body else ''
+                    if notes_text:
+                        elements.append(DocumentElement(
+                            text=notes_text,
+                            page_number=slide_num,
+                            element_type='notes',
+                            bbox=(0, 1000, 500, 1100),
+                            confidence=1.0,
+                            language=self._detect_language(notes_text),
+                            font_info={'type': 'slide_notes', 'slide_number': slide_num}
+                        ))
+            
+            # Extract presentation metadata from the core properties part
+            try:
+                core = etree.fromstring(archive.read('docProps/core.xml'))
+            except KeyError:
+                core = None
+            
+            def core_property(tag):
+                value = core.findtext(tag, default='', namespaces=ns) if core is not None else ''
+                return (value or '').strip()
+            
+            metadata = {
+                'file_type': 'pptx',
+                'size': file_path.stat().st_size,
+                'slides': len(slide_parts),
+                'title': core_property('dc:title'),
+                'author': core_property('dc:creator'),
+                'subject': core_property('dc:subject'),
+                'created': core_property('dcterms:created'),
+                'modified': core_property('dcterms:modified')
+            }
+        
+        self.logger.info(f"PowerPoint processing completed. Extracted {len(elements)} elements from {len(slide_parts)} slides")
+        
+        return ProcessedDocument(
+            filename=file_path.name,
+            total_pages=len(slide_parts),
+            elements=elements,
+            metadata=metadata
+        )
+    
+    async def _process_pptx_with_python_pptx(self, file_path: Path) -> ProcessedDocument:
         """Enhanced PowerPoint processing with comprehensive content extraction"""
         try:
             prs = Presentation(file_path)
@@ -583,7 +1055,7 @@ class DocumentProcessor:
                         # Handle text shapes
                         if hasattr(shape, 'text') and shape.text.strip():
                             # Enhanced element type determination
-                            element_type = self._determine_pptx_element_type(shape, slide_title)
+                            element_type = self._determine_pptx_element_type(shape.text, slide_title)
                             
                             # Extract rich text formatting if available
                             font_info = self._extract_shape_formatting(shape)
@@ -601,12 +1073,17 @@ class DocumentProcessor:
                         
                         # Handle tables
                         elif hasattr(shape, 'table'):
-                            table_elements = self._extract_pptx_table(shape.table, slide_num)
+                            table_elements = self._extract_pptx_table(
+                                ([cell.text.strip() if cell.text else '' for cell in row.cells] for row in shape.table.rows),
+                                slide_num
+                            )
                             elements.extend(table_elements)
                         
                         # Handle charts (basic info extraction)
                         elif hasattr(shape, 'chart'):
-                            chart_info = self._extract_pptx_chart_info(shape.chart, slide_num)
+                            chart_info = self._extract_pptx_chart_info(
+                                getattr(shape.chart, 'chart_title', 'Untitled Chart'), slide_num
+                            )
                             if chart_info:
                                 elements.append(chart_info)
                         
@@ -662,63 +1139,70 @@ class DocumentProcessor:
     async def _process_image(self, file_path: Path) -> ProcessedDocument:
         """Process image files with enhanced OCR and preprocessing"""
         try:
+            import cv2
+            
             self.logger.info(f"Starting enhanced image processing for: {file_path.name}")
             
-            # Load and validate image
-            image = cv2.imread(str(file_path))
-            original_image = None
+            # Load and validate image: read the file once, decode from memory
+            image_bytes = np.fromfile(str(file_path), dtype=np.uint8)
+            image = cv2.imdecode(image_bytes, cv2.IMREAD_COLOR) if image_bytes.size else None
             
             if image is None:
                 # Try with PIL as fallback
                 try:
-                    pil_image = Image.open(str(file_path))
+                    pil_image = Image.open(io.BytesIO(image_bytes))
                     # Convert PIL to cv2 format
                     image = cv2.cvtColor(np.array(pil_image), cv2.COLOR_RGB2BGR)
-                    original_image = np.array(pil_image)
                     self.logger.info("Image loaded using PIL fallback")
                 except Exception as pil_error:
                     raise ValueError(f"Could not load image {file_path.name}. CV2 error: Image is None. PIL error: {pil_error}")
-            else:
-                original_image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+            
+            # On CPU, Tesseract alone is faster than EasyOCR for small images
+            small_cpu_image = not self.ocr_gpu and image.shape[0] * image.shape[1] < self._SMALL_IMAGE_PIXELS
             
             # Enhanced image preprocessing for better OCR
-            processed_images = self._preprocess_image_for_ocr(image)
+            if small_cpu_image:
+                self.logger.info("Small image on CPU, using Tesseract instead of EasyOCR variants")
+                processed_images = []
+            else:
+                # Only the EasyOCR path needs the readers; small CPU images skip loading them
+                self._ensure_ocr_engines()
+                processed_images = self._preprocess_image_for_ocr(image)
             
             elements = []
             best_results = []
             
+            # Choose OCR method based on what's available
+            use_easyocr = bool(processed_images) and not (self.use_tesseract_fallback or not self.primary_ocr_reader)
+            easyocr_batches = None
+            if use_easyocr:
+                # All preprocessed versions share the source dimensions, so EasyOCR can
+                # detect and recognize them in small batches straight from memory
+                try:
+                    self.logger.info(f"Running batched EasyOCR on {len(processed_images)} preprocessed versions...")
+                    if self._ocr_pool is not None:
+                        # Hand the batch to a worker process so OCR runs in parallel across uploads
+                        loop = asyncio.get_running_loop()
+                        easyocr_batches = await loop.run_in_executor(
+                            None, self._ocr_pool.apply, _ocr_worker_readtext_batched, (processed_images,)
+                        )
+                    else:
+                        easyocr_batches = self.primary_ocr_reader.readtext_batched(
+                            processed_images, batch_size=_EASYOCR_BATCH_SIZE
+                        )
+                except Exception as ocr_error:
+                    self.logger.warning(f"EasyOCR failed: {ocr_error}, trying Tesseract...")
+            
             # Try OCR on multiple preprocessed versions and combine results
             for i, processed_img in enumerate(processed_images):
                 try:
                     self.logger.info(f"Running OCR on preprocessed image {i+1}/{len(processed_images)}...")
                     
-                    ocr_results = []
-                    
-                    # Choose OCR method based on what's available
-                    if self.use_tesseract_fallback or not self.primary_ocr_reader:
+                    if easyocr_batches is not None:
+                        ocr_results = easyocr_batches[i]
+                    else:
                         # Use Tesseract OCR
                         ocr_results = self._extract_text_with_tesseract_direct(processed_img, i)
-                    else:
-                        # Use EasyOCR
-                        # Save processed image temporarily for EasyOCR
-                        temp_path = file_path.parent / f"temp_processed_{i}_{file_path.name}"
-                        cv2.imwrite(str(temp_path), processed_img)
-                        
-                        try:
-                            selected_reader = self.primary_ocr_reader or self.ocr_reader
-                            if selected_reader:
-                                # Perform OCR with EasyOCR
-                                ocr_results = selected_reader.readtext(str(temp_path))
-                            else:
-                                self.logger.warning("No EasyOCR reader available")
-                                ocr_results = []
-                        except Exception as ocr_error:
-                            self.logger.warning(f"EasyOCR failed: {ocr_error}, trying Tesseract...")
-                            ocr_results = self._extract_text_with_tesseract_direct(processed_img, i)
-                        finally:
-                            # Clean up temp file
-                            if temp_path.exists():
-                                temp_path.unlink()
                     
                     # Store results with preprocessing info
                     for result in ocr_results:
@@ -731,10 +1215,14 @@ class DocumentProcessor:
                     self.logger.warning(f"OCR failed on preprocessed version {i+1}: {ocr_error}")
                     continue
             
-            # Also try Tesseract OCR as backup
+            # Also try Tesseract OCR as backup (the primary engine for small CPU images)
             try:
                 self.logger.info("Trying Tesseract OCR as backup...")
-                tesseract_results = self._extract_text_with_tesseract(image, file_path)
+                tesseract_results = []
+                if small_cpu_image:
+                    tesseract_results = self._extract_text_with_tesseract(image, file_path, lang='eng+hin+kan')
+                if not tesseract_results:
+                    tesseract_results = self._extract_text_with_tesseract(image, file_path)
                 best_results.extend(tesseract_results)
             except Exception as tess_error:
                 self.logger.warning(f"Tesseract OCR failed: {tess_error}")
@@ -878,9 +1366,8 @@ class DocumentProcessor:
                 raw_data = f.read()
                 encoding = chardet.detect(raw_data)['encoding'] or 'utf-8'
             
-            # Read text content
-            with open(file_path, 'r', encoding=encoding) as f:
-                content = f.read()
+            # Decode the bytes already in memory (universal newlines, as text-mode open would)
+            content = raw_data.decode(encoding).replace('\r\n', '\n').replace('\r', '\n')
             
             elements = []
             
@@ -1034,8 +1521,8 @@ class DocumentProcessor:
     async def _process_json(self, file_path: Path) -> ProcessedDocument:
         """Process JSON files"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            raw_data = await asyncio.to_thread(file_path.read_bytes)
+            data = orjson.loads(raw_data) if ORJSON_AVAILABLE else json.loads(raw_data.decode('utf-8'))
             
             elements = []
             
@@ -1081,7 +1568,7 @@ class DocumentProcessor:
                 filename=file_path.name,
                 total_pages=1,
                 elements=elements,
-                metadata={'file_type': 'json', 'size': file_path.stat().st_size}
+                metadata={'file_type': 'json', 'size': len(raw_data)}
             )
             
         except Exception as e:
@@ -1261,69 +1748,59 @@ class DocumentProcessor:
             self.logger.debug(f"Text normalization failed: {e}")
             return 'unknown'
         
-        # Try using the advanced Indian language detector first
+        # Repeated boilerplate (headers, footers, OCR variants) hits the cache
+        return self._detect_normalized_language(text)
+    
+    def _detect_normalized_language_uncached(self, text: str) -> str:
+        """Detect the language of already-normalized text (wrapped by the _detect_normalized_language cache)"""
+        # fastText model runs in native code; a prefix is enough for a confident label
+        if FAST_LANGDETECT_AVAILABLE:
+            try:
+                result = fast_langdetect(text[:80])
+                if isinstance(result, list):  # Newer releases return top-k candidates
+                    result = result[0] if result else {}
+                if result.get('score', 0) > 0.4 and result.get('lang'):
+                    return result['lang'].split('-')[0].lower()
+            except Exception as e:
+                self.logger.debug(f"fast-langdetect failed, falling back: {e}")
+        
+        # Then the advanced Indian language detector
         try:
-            from src.utils.indian_language_detector import detect_indian_language
-            detection = detect_indian_language(text)
+            # Detector instance directly: this method's own cache already covers repeats
+            from src.utils.indian_language_detector import get_indian_language_detector
+            detection = get_indian_language_detector().detect_language(text)
             if detection.confidence > 0.4:  # Lowered threshold for better detection
                 self.logger.debug(f"Detected language: {detection.language_code} ({detection.confidence:.2f})")
                 return detection.language_code
         except Exception as e:
             self.logger.debug(f"Indian language detection failed, falling back to simple detection: {e}")
         
-        # Fallback: Count different script characters
-        latin_chars = sum(1 for c in text if c.isascii() and c.isalpha())
-        arabic_chars = sum(1 for c in text if '\u0600' <= c <= '\u06FF')
-        # Devanagari script (Hindi, Marathi, etc.)
-        devanagari_chars = sum(1 for c in text if '\u0900' <= c <= '\u097F')
-        # Kannada script
-        kannada_chars = sum(1 for c in text if '\u0C80' <= c <= '\u0CFF')
-        # Telugu script
-        telugu_chars = sum(1 for c in text if '\u0C00' <= c <= '\u0C7F')
-        # Tamil script
-        tamil_chars = sum(1 for c in text if '\u0B80' <= c <= '\u0BFF')
-        # Bengali script
-        bengali_chars = sum(1 for c in text if '\u0980' <= c <= '\u09FF')
-        # Gujarati script
-        gujarati_chars = sum(1 for c in text if '\u0A80' <= c <= '\u0AFF')
-        # Malayalam script
-        malayalam_chars = sum(1 for c in text if '\u0D00' <= c <= '\u0D7F')
-        # Punjabi script (Gurmukhi)
-        punjabi_chars = sum(1 for c in text if '\u0A00' <= c <= '\u0A7F')
+        # Fallback: Count different script characters in one vectorized pass over code points
+        codepoints = np.frombuffer(text.encode('utf-32-le', errors='ignore'), dtype=np.uint32)
+        folded = codepoints | 0x20  # Fold ASCII upper case onto lower case
+        latin_chars = int(((folded >= 0x61) & (folded <= 0x7A)).sum())
+        script_counts = [
+            int(((codepoints >= low) & (codepoints <= high)).sum())
+            for _, low, high in self._SCRIPT_RANGES
+        ]
         
-        total_chars = (latin_chars + arabic_chars + devanagari_chars + 
-                      kannada_chars + telugu_chars + tamil_chars + 
-                      bengali_chars + gujarati_chars + malayalam_chars + punjabi_chars)
+        total_chars = latin_chars + sum(script_counts)
         
         if total_chars == 0:
             return 'unknown'
         
-        # Determine dominant script with threshold of 20%
+        # Determine dominant script with threshold of 20% (ranges are in priority order)
         threshold = 0.2
         
-        if kannada_chars / total_chars > threshold:
-            return 'kn'
-        elif telugu_chars / total_chars > threshold:
-            return 'te'
-        elif tamil_chars / total_chars > threshold:
-            return 'ta'
-        elif devanagari_chars / total_chars > threshold:
-            return 'hi'  # Could be Hindi or Marathi, default to Hindi
-        elif bengali_chars / total_chars > threshold:
-            return 'bn'
-        elif gujarati_chars / total_chars > threshold:
-            return 'gu'
-        elif malayalam_chars / total_chars > threshold:
-            return 'ml'
-        elif punjabi_chars / total_chars > threshold:
-            return 'pa'
-        elif arabic_chars / total_chars > threshold:
-            return 'ar'
-        else:
-            return 'en'
+        for (language, _, _), count in zip(self._SCRIPT_RANGES, script_counts):
+            if count / total_chars > threshold:
+                return language
+        return 'en'
     
     def _preprocess_image_for_ocr(self, image: np.ndarray) -> List[np.ndarray]:
         """Apply various preprocessing techniques to improve OCR accuracy"""
+        import cv2
+        
         preprocessed_images = []
         
         try:
@@ -1366,8 +1843,10 @@ class DocumentProcessor:
         
         return preprocessed_images
     
-    def _extract_text_with_tesseract(self, image: np.ndarray, file_path: Path) -> List[Tuple[Any, int]]:
+    def _extract_text_with_tesseract(self, image: np.ndarray, file_path: Path, lang: Optional[str] = None) -> List[Tuple[Any, int]]:
         """Extract text using Tesseract OCR as backup"""
+        import cv2
+        
         results = []
         
         try:
@@ -1375,14 +1854,16 @@ class DocumentProcessor:
             pil_image = Image.fromarray(cv2.cvtColor(image, cv2.COLOR_BGR2RGB))
             
             # Get text with bounding boxes
-            data = pytesseract.image_to_data(pil_image, output_type=pytesseract.Output.DICT)
-            
-            for i in range(len(data['text'])):
-                text = data['text'][i].strip()
-                confidence = int(data['conf'][i])
+            words = self._tesserocr_words(pil_image, lang) if TESSEROCR_AVAILABLE else None
+            if words is None:
+                data = pytesseract.image_to_data(pil_image, output_type=pytesseract.Output.DICT, lang=lang)
+                words = zip(data['text'], data['left'], data['top'], data['width'], data['height'], data['conf'])
+            
+            for raw_text, x, y, w, h, raw_confidence in words:
+                text = raw_text.strip()
+                confidence = int(float(raw_confidence))
                 
                 if text and confidence > 30:  # Minimum confidence
-                    x, y, w, h = data['left'][i], data['top'][i], data['width'][i], data['height'][i]
                     bbox = [x, y, w, h]
                     
                     # Format: (text, bbox, confidence/100)
@@ -1395,8 +1876,36 @@ class DocumentProcessor:
         
         return results
     
+    def _tesserocr_words(self, pil_image: Image.Image, lang: Optional[str]) -> Optional[List[Tuple[str, int, int, int, int, float]]]:
+        """Word-level OCR through a reused tesserocr handle; None if the language can't be loaded"""
+        lang = lang or 'eng'
+        with self._tesseract_lock:
+            api = self._tesseract_apis.get(lang)
+            if api is None:
+                try:
+                    api = PyTessBaseAPI(lang=lang)
+                except RuntimeError as e:
+                    self.logger.debug(f"tesserocr could not load '{lang}': {e}")
+                    api = False  # Remember the failure; use pytesseract for this language
+                self._tesseract_apis[lang] = api
+            if api is False:
+                return None
+            
+            api.SetImage(pil_image)
+            api.Recognize()
+            words = []
+            for word in iterate_level(api.GetIterator(), RIL.WORD):
+                text = word.GetUTF8Text(RIL.WORD)
+                box = word.BoundingBox(RIL.WORD)
+                if text and box:
+                    x1, y1, x2, y2 = box
+                    words.append((text, x1, y1, x2 - x1, y2 - y1, word.Confidence(RIL.WORD)))
+            return words
+    
     def _extract_text_with_tesseract_direct(self, image: np.ndarray, version: int) -> List[Tuple[Any, int]]:
         """Extract text using Tesseract OCR directly from image array with multilingual support"""
+        import cv2
+        
         results = []
         
         try:
@@ -1555,33 +2064,22 @@ class DocumentProcessor:
     
     def get_document_stats(self, document: ProcessedDocument) -> Dict[str, Any]:
         """Generate statistics about the processed document"""
-        stats = {
-            'total_elements': len(document.elements),
-            'total_pages': document.total_pages,
-            'element_types': {},
-            'languages': {},
-            'avg_confidence': 0,
-            'total_text_length': 0
-        }
-        
-        for element in document.elements:
-            # Count element types
-            stats['element_types'][element.element_type] = \
-                stats['element_types'].get(element.element_type, 0) + 1
-            
-            # Count languages
-            if element.language:
-                stats['languages'][element.language] = \
-                    stats['languages'].get(element.language, 0) + 1
-            
-            # Calculate averages
-            stats['avg_confidence'] += element.confidence
-            stats['total_text_length'] += len(element.text)
+        # Stats never read bboxes; skipping them also keeps a malformed bbox from failing the call
+        columns = document.to_columns(include_bboxes=False)
+        count = len(columns.texts)
         
-        if document.elements:
-            stats['avg_confidence'] /= len(document.elements)
+        # Count element types with one bincount over the categorical ids
+        type_counts = np.bincount(columns.type_ids, minlength=len(columns.type_names)) if count else []
+        languages = Counter(language for language in columns.languages if language)
         
-        return stats
+        return {
+            'total_elements': count,
+            'total_pages': document.total_pages,
+            'element_types': {name: int(n) for name, n in zip(columns.type_names, type_counts)},
+            'languages': dict(languages),
+            'avg_confidence': float(columns.confidences.mean()) if count else 0,
+            'total_text_length': sum(map(len, columns.texts))
+        }
     
     # Helper methods for PowerPoint processing
     def _extract_slide_title(self, slide):
@@ -1596,11 +2094,11 @@ class DocumentProcessor:
         except Exception:
             return None
     
-    def _determine_pptx_element_type(self, shape, slide_title):
-        """Determine element type for PowerPoint shapes"""
+    def _determine_pptx_element_type(self, text, slide_title):
+        """Determine element type for PowerPoint shape text"""
         try:
-            if hasattr(shape, 'text') and shape.text:
-                text = shape.text.strip()
+            if text:
+                text = text.strip()
                 # If this is the first text and matches slide title, it's a heading
                 if slide_title and text == slide_title:
                     return 'heading'
@@ -1623,15 +2121,11 @@ class DocumentProcessor:
         except Exception:
             return {'shape_type': 'unknown'}
     
-    def _extract_pptx_table(self, table, slide_num):
-        """Extract table content from PowerPoint"""
+    def _extract_pptx_table(self, rows, slide_num):
+        """Extract table content from PowerPoint (rows given as lists of cell texts)"""
         elements = []
         try:
-            for row_idx, row in enumerate(table.rows):
-                row_text = []
-                for cell in row.cells:
-                    row_text.append(cell.text.strip() if cell.text else '')
-                
+            for row_idx, row_text in enumerate(rows):
                 if any(text for text in row_text):  # If any cell has content
                     element = DocumentElement(
                         text=' | '.join(row_text),
@@ -1646,10 +2140,10 @@ class DocumentProcessor:
             self.logger.warning(f"Error extracting table: {e}")
         return elements
     
-    def _extract_pptx_chart_info(self, chart, slide_num):
+    def _extract_pptx_chart_info(self, chart_title, slide_num):
         """Extract basic chart information"""
         try:
-            chart_text = f"Chart: {getattr(chart, 'chart_title', 'Untitled Chart')}"
+            chart_text = f"Chart: {chart_title}"
             return DocumentElement(
                 text=chart_text,
                 page_number=slide_num,
@@ -15,7 +15,8 @@ from pathlib import Path
 
 # MongoDB imports
 from motor.motor_asyncio import AsyncIOMotorClient
-from pymongo import ASCENDING, DESCENDING, TEXT
+from pymongo import ASCENDING, DESCENDING, TEXT, IndexModel
+from pymongo.errors import BulkWriteError
 from bson import ObjectId
 
 from src.models.ai_models import AIModelManager
@@ -40,6 +41,43 @@ class SearchResult:
     score: float
     relevance: str  # 'high', 'medium', 'low'
 
+# Fields the text fallbacks read from a chunk (skips the embedding vector)
+_CHUNK_TEXT_PROJECTION = {"text": 1, "page_number": 1, "document_id": 1, "chunk_id": 1, "_id": 0}
+
+# One client (and connection pool) per server URL, shared by every per-user store
+_shared_clients: Dict[str, AsyncIOMotorClient] = {}
+
+def _get_shared_client(mongo_url: str) -> AsyncIOMotorClient:
+    """Get or create the pooled Motor client for a MongoDB URL"""
+    client = _shared_clients.get(mongo_url)
+    if client is None:
+        # Keep a warm pool so concurrent requests don't queue behind connection setup
+        client = AsyncIOMotorClient(
+            mongo_url,
+            maxPoolSize=100,
+            minPoolSize=10,
+            maxIdleTimeMS=300000,
+            maxConnecting=4,
+            serverSelectionTimeoutMS=5000
+        )
+        _shared_clients[mongo_url] = client
+    return client
+
+# Databases whose indexes were already ensured by this process
+_indexed_databases: set = set()
+
+async def close_shared_clients():
+    """Close every shared Motor client (await once on application shutdown)"""
+    clients = list(_shared_clients.values())
+    _shared_clients.clear()
+    _indexed_databases.clear()
+    # close() blocks while the pool tears down; keep it off the event loop and
+    # finish it before the loop exits so sockets aren't left behind
+    await asyncio.gather(
+        *[asyncio.to_thread(client.close) for client in clients],
+        return_exceptions=True
+    )
+
 class MongoDBStore:
     """MongoDB-based document storage and vector search for PolyDoc"""
     
@@ -78,9 +116,10 @@ class MongoDBStore:
     async def connect(self):
         """Connect to MongoDB and create user-specific database"""
         try:
-            self.client = AsyncIOMotorClient(self.mongo_base_url)
-            
-            # Test connection
+            # Reuse the pooled client so each new user doesn't pay DNS/TCP setup again
+            self.client = _get_shared_client(self.mongo_base_url)
+
+            # Test connection (also opens the first pooled socket)
             await self.client.admin.command('ping')
             
             # Create user-specific database name
@@ -109,40 +148,50 @@ class MongoDBStore:
     async def disconnect(self):
         """Disconnect from MongoDB"""
         if self.client:
-            self.client.close()
+            # The client is shared with other stores; close_shared_clients() tears it down
+            self.client = None
+            self.db = None
             self.logger.info("Disconnected from MongoDB")
     
     async def _create_indexes(self):
         """Create necessary indexes for optimal performance"""
+        if self.db.name in _indexed_databases:
+            return  # Already ensured for this database; skip the round-trips
+        
         try:
             # Documents collection indexes
-            await self.db[self.documents_collection].create_index([
-                ("user_id", ASCENDING),
-                ("created_at", DESCENDING)
+            await self.db[self.documents_collection].create_indexes([
+                IndexModel([("user_id", ASCENDING), ("created_at", DESCENDING)])
             ])
             
-            # Document chunks indexes
-            await self.db[self.chunks_collection].create_index([
-                ("document_id", ASCENDING)
-            ])
-            await self.db[self.chunks_collection].create_index([
-                ("user_id", ASCENDING)
+            # Plain chunk indexes go in their own call, so a conflicting text index can't block them
+            await self.db[self.chunks_collection].create_indexes([
+                IndexModel([("document_id", ASCENDING)]),
+                IndexModel([("user_id", ASCENDING)])
             ])
             
-            # Text search index for chunks (language-agnostic to support all languages)
-            try:
-                await self.db[self.chunks_collection].create_index([
-                    ("text", TEXT)
-                ], default_language='none')  # Use 'none' to disable language-specific stemming
-            except Exception as text_index_error:
-                self.logger.warning(f"Could not create language-specific text index: {text_index_error}")
-                # Fallback: create basic text index without language support
+            text_index_ready = await self._has_multilingual_text_index()
+            if not text_index_ready:
+                # Build in the background only when there is existing data to index
+                chunk_count = await self.db[self.chunks_collection].estimated_document_count()
+                build_in_background = chunk_count > 0
                 try:
-                    await self.db[self.chunks_collection].create_index([
-                        ("text", TEXT)
+                    # Language-agnostic text index; 'none' disables language-specific stemming
+                    await self.db[self.chunks_collection].create_indexes([
+                        IndexModel([("text", TEXT)], name="text_search_multilingual",
+                                   default_language='none', background=build_in_background)
                     ])
-                except Exception as fallback_error:
-                    self.logger.warning(f"Could not create fallback text index: {fallback_error}")
+                    text_index_ready = True
+                except Exception as text_index_error:
+                    self.logger.warning(f"Could not create language-specific text index: {text_index_error}")
+                    # Fallback: create basic text index without language support
+                    try:
+                        await self.db[self.chunks_collection].create_indexes([
+                            IndexModel([("text", TEXT)], background=build_in_background)
+                        ])
+                        text_index_ready = True
+                    except Exception as fallback_error:
+                        self.logger.warning(f"Could not create fallback text index: {fallback_error}")
             
             # Chat sessions indexes
             await self.db[self.chat_sessions_collection].create_index([
@@ -150,11 +199,26 @@ class MongoDBStore:
                 ("updated_at", DESCENDING)
             ])
             
-            self.logger.info("MongoDB indexes created successfully")
+            # Only skip future attempts once every index is in place
+            if text_index_ready:
+                _indexed_databases.add(self.db.name)
+                self.logger.info("MongoDB indexes created successfully")
             
         except Exception as e:
             self.logger.warning(f"Error creating indexes: {e}")
     
+    async def _has_multilingual_text_index(self) -> bool:
+        """Check whether the chunks collection already has a text index with default_language 'none'"""
+        try:
+            index_info = await self.db[self.chunks_collection].index_information()
+        except Exception:
+            return False
+        
+        for info in index_info.values():
+            if any(direction == TEXT for _, direction in info.get('key', [])):
+                return info.get('default_language') == 'none'
+        return False
+    
     async def _ensure_user_record(self):
         """Create user record if it doesn't exist"""
         try:
@@ -349,32 +413,35 @@ class MongoDBStore:
                     await self.db[self.chunks_collection].insert_many(chunk_documents)
                 except Exception as batch_error:
                     self.logger.warning(f"Batch insert failed: {batch_error}")
-                    # Fallback: insert documents one by one
-                    self.logger.info("Falling back to individual document insertion...")
-                    successful_inserts = 0
-                    for chunk_doc in chunk_documents:
-                        try:
-                            # Keep only essential fields to avoid language indexing issues
-                            essential_fields = {
-                                "_id": chunk_doc["_id"],
-                                "chunk_id": chunk_doc["chunk_id"],
-                                "document_id": chunk_doc["document_id"],
-                                "user_id": chunk_doc["user_id"],
-                                "text": chunk_doc["text"],
-                                "page_number": chunk_doc["page_number"],
-                                "element_type": chunk_doc["element_type"],
-                                "bbox": chunk_doc["bbox"],
-                                "language": chunk_doc["language"],
-                                "embedding": chunk_doc["embedding"],
-                                "metadata": chunk_doc["metadata"],
-                                "created_at": chunk_doc["created_at"]
-                            }
-                            await self.db[self.chunks_collection].insert_one(essential_fields)
-                            successful_inserts += 1
-                        except Exception as individual_error:
-                            self.logger.warning(f"Failed to insert chunk {chunk_doc['chunk_id']}: {individual_error}")
-                            continue
-                    
+                    # Fallback: unordered batch so one bad chunk doesn't abort the rest
+                    self.logger.info("Falling back to unordered batch insertion...")
+                    # Keep only essential fields to avoid language indexing issues
+                    essential_docs = [
+                        {
+                            "_id": chunk_doc["_id"],
+                            "chunk_id": chunk_doc["chunk_id"],
+                            "document_id": chunk_doc["document_id"],
+                            "user_id": chunk_doc["user_id"],
+                            "text": chunk_doc["text"],
+                            "page_number": chunk_doc["page_number"],
+                            "element_type": chunk_doc["element_type"],
+                            "bbox": chunk_doc["bbox"],
+                            "language": chunk_doc["language"],
+                            "embedding": chunk_doc["embedding"],
+                            "metadata": chunk_doc["metadata"],
+                            "created_at": chunk_doc["created_at"]
+                        }
+                        for chunk_doc in chunk_documents
+                    ]
+                    try:
+                        result = await self.db[self.chunks_collection].insert_many(essential_docs, ordered=False)
+                        successful_inserts = len(result.inserted_ids)
+                    except BulkWriteError as bwe:
+                        successful_inserts = bwe.details.get('nInserted', 0)
+                        for write_error in bwe.details.get('writeErrors', []):
+                            failed_chunk = essential_docs[write_error['index']]
+                            self.logger.warning(f"Failed to insert chunk {failed_chunk['chunk_id']}: {write_error.get('errmsg')}")
+
                     chunks_added = successful_inserts
                     self.logger.info(f"Successfully inserted {successful_inserts}/{len(chunk_documents)} chunks")
             
@@ -503,6 +570,9 @@ class MongoDBStore:
             # Limit results
             pipeline.append({"$limit": top_k})
             
+            # Vectors are only needed for scoring; don't ship them back over the wire
+            pipeline.append({"$project": {"embedding": 0}})
+            
             # Execute aggregation pipeline
             cursor = self.db[self.chunks_collection].aggregate(pipeline)
             results = []
@@ -517,7 +587,7 @@ class MongoDBStore:
                     element_type=doc["element_type"],
                     bbox=tuple(doc["bbox"]),
                     language=doc["language"],
-                    embedding=doc["embedding"],
+                    embedding=doc.get("embedding"),
                     metadata=doc.get("metadata")
                 )
                 
@@ -656,18 +726,9 @@ class MongoDBStore:
                 if text_patterns:
                     match_stage["$or"] = text_patterns
             
-            cursor = self.db[self.chunks_collection].find(match_stage).limit(top_k)
-            results = []
-            
-            async for doc in cursor:
-                # Create a simple result object
-                chunk_data = {
-                    'text': doc['text'],
-                    'page_number': doc['page_number'],
-                    'document_id': doc['document_id'],
-                    'chunk_id': doc['chunk_id']
-                }
-                results.append(chunk_data)
+            # The projection already shapes each result, so take the whole (limited) batch at once
+            cursor = self.db[self.chunks_collection].find(match_stage, _CHUNK_TEXT_PROJECTION).limit(top_k)
+            results = await cursor.to_list(length=top_k)
             
             self.logger.info(f"Fallback text search found {len(results)} chunks")
             return results
@@ -688,17 +749,8 @@ class MongoDBStore:
             if document_id:
                 match_stage["document_id"] = document_id
             
-            cursor = self.db[self.chunks_collection].find(match_stage).limit(limit)
-            results = []
-            
-            async for doc in cursor:
-                chunk_data = {
-                    'text': doc['text'],
-                    'page_number': doc['page_number'],
-                    'document_id': doc['document_id'],
-                    'chunk_id': doc['chunk_id']
-                }
-                results.append(chunk_data)
+            cursor = self.db[self.chunks_collection].find(match_stage, _CHUNK_TEXT_PROJECTION).limit(limit)
+            results = await cursor.to_list(length=limit)
             
             self.logger.info(f"Retrieved {len(results)} available chunks for user")
             return results
@@ -733,17 +785,26 @@ class MongoDBStore:
     async def list_user_documents(self, user_id: str) -> List[Dict[str, Any]]:
         """List all documents for a user"""
         try:
+            # Large batches keep getMore round-trips down for users with many documents
             cursor = self.db[self.documents_collection].find(
                 {"user_id": user_id},
-                sort=[("created_at", DESCENDING)]
+                sort=[("created_at", DESCENDING)],
+                batch_size=1000
             )
+            docs = await cursor.to_list(length=None)
+            
+            # Chunk counts for every listed document in one aggregation (not one count per document)
+            chunk_counts = {}
+            if docs:
+                counts_cursor = self.db[self.chunks_collection].aggregate([
+                    {"$match": {"document_id": {"$in": [str(doc["_id"]) for doc in docs]}}},
+                    {"$group": {"_id": "$document_id", "count": {"$sum": 1}}}
+                ], batchSize=1000)
+                chunk_counts = {row["_id"]: row["count"] async for row in counts_cursor}
             
             documents = []
-            async for doc in cursor:
-                # Count chunks for this document
-                chunk_count = await self.db[self.chunks_collection].count_documents({
-                    "document_id": str(doc["_id"])
-                })
+            for doc in docs:
+                chunk_count = chunk_counts.get(str(doc["_id"]), 0)
                 
                 documents.append({
                     "document_id": str(doc["_id"]),
@@ -822,27 +883,30 @@ class MongoDBStore:
     async def get_statistics(self) -> Dict[str, Any]:
         """Get database statistics"""
         try:
-            stats = {
-                "total_documents": await self.db[self.documents_collection].count_documents({}),
-                "total_chunks": await self.db[self.chunks_collection].count_documents({}),
-                "total_chat_sessions": await self.db[self.chat_sessions_collection].count_documents({}),
-                "database_name": self.db.name,
-                "connection_string": self.mongo_base_url.split('@')[-1] if '@' in self.mongo_base_url else self.mongo_base_url
-            }
-            
             # Language distribution
             pipeline = [
                 {"$group": {"_id": "$language", "count": {"$sum": 1}}},
-                {"$sort": {"count": -1}}
+                {"$sort": {"count": -1}},
+                {"$project": {"_id": 0, "language": "$_id", "count": 1}}
             ]
             
-            language_stats = []
-            async for doc in self.db[self.documents_collection].aggregate(pipeline):
-                language_stats.append({"language": doc["_id"], "count": doc["count"]})
-            
-            stats["languages"] = language_stats
+            # Overview totals come from collection metadata (O(1), may be briefly stale after an
+            # unclean shutdown) and run concurrently with the language aggregation
+            languages, total_documents, total_chunks, total_chat_sessions = await asyncio.gather(
+                self.db[self.documents_collection].aggregate(pipeline, allowDiskUse=True).to_list(length=None),
+                self.db[self.documents_collection].estimated_document_count(),
+                self.db[self.chunks_collection].estimated_document_count(),
+                self.db[self.chat_sessions_collection].estimated_document_count()
+            )
             
-            return stats
+            return {
+                "total_documents": total_documents,
+                "total_chunks": total_chunks,
+                "total_chat_sessions": total_chat_sessions,
+                "database_name": self.db.name,
+                "connection_string": self.mongo_base_url.split('@')[-1] if '@' in self.mongo_base_url else self.mongo_base_url,
+                "languages": languages
+            }
             
         except Exception as e:
             self.logger.error(f"Error getting statistics: {e}")
@@ -9,13 +9,33 @@ import json
 import pickle
 import os
 from typing import Dict, List, Any, Optional, Tuple
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields
 import numpy as np
 import faiss
 from pathlib import Path
 
+# Native JSON encoder/decoder (optional, stdlib json is the fallback)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
 from src.models.ai_models import AIModelManager
 
+def _json_dumps(obj: Any, indent: bool = False) -> bytes:
+    """Encode obj as UTF-8 JSON bytes"""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None).encode('utf-8')
+
+def _json_load(path: Path) -> Any:
+    """Parse a UTF-8 JSON file"""
+    data = path.read_bytes()
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data.decode('utf-8'))
+
 @dataclass
 class DocumentChunk:
     """Represents a chunk of document with metadata"""
@@ -368,21 +388,21 @@ class VectorStore:
             index_path = self.store_path / "faiss_index.idx"
             faiss.write_index(self.index, str(index_path))
             
-            # Save chunks (without embeddings to save space)
-            chunks_data = {}
-            for chunk_id, chunk in self.chunks.items():
-                chunk_dict = asdict(chunk)
-                chunk_dict['embedding'] = None  # Don't save embedding separately
-                chunks_data[chunk_id] = chunk_dict
-            
+            # Save chunks (without embeddings to save space), streamed one chunk at a time
+            # instead of deep-copying the whole store into a dict first
             chunks_path = self.store_path / "chunks.json"
-            with open(chunks_path, 'w', encoding='utf-8') as f:
-                json.dump(chunks_data, f, ensure_ascii=False, indent=2)
+            with open(chunks_path, 'wb') as f:
+                f.write(b'{')
+                for i, (chunk_id, chunk) in enumerate(self.chunks.items()):
+                    chunk_dict = {field.name: getattr(chunk, field.name) for field in fields(chunk)}
+                    chunk_dict['embedding'] = None  # Don't save embedding separately
+                    f.write(b',\n  ' if i else b'\n  ')
+                    f.write(_json_dumps(chunk_id) + b': ' + _json_dumps(chunk_dict))
+                f.write(b'\n}')
             
             # Save document metadata
             metadata_path = self.store_path / "metadata.json"
-            with open(metadata_path, 'w', encoding='utf-8') as f:
-                json.dump(self.document_metadata, f, ensure_ascii=False, indent=2)
+            metadata_path.write_bytes(_json_dumps(self.document_metadata, indent=True))
             
             self.logger.info("Vector store saved successfully")
             
@@ -404,8 +424,7 @@ class VectorStore:
             self.index = faiss.read_index(str(index_path))
             
             # Load chunks
-            with open(chunks_path, 'r', encoding='utf-8') as f:
-                chunks_data = json.load(f)
+            chunks_data = _json_load(chunks_path)
             
             for chunk_id, chunk_dict in chunks_data.items():
                 # Convert back to DocumentChunk
@@ -422,8 +441,7 @@ class VectorStore:
                 self.chunks[chunk_id] = chunk
             
             # Load metadata
-            with open(metadata_path, 'r', encoding='utf-8') as f:
-                self.document_metadata = json.load(f)
+            self.document_metadata = _json_load(metadata_path)
             
             self.logger.info(f"Loaded vector store with {len(self.chunks)} chunks")
             
@@ -4,8 +4,17 @@ Uses Hugging Face transformers for multilingual understanding and summarization
 """
 
 import asyncio
+import functools
+import hashlib
 import logging
-from typing import Dict, List, Any, Optional, Tuple
+import os
+import re
+import shutil
+import time
+from pathlib import Path
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, Tuple, Iterable, Iterator, Union
 import torch
 from transformers import (
     AutoTokenizer, AutoModel, AutoModelForSeq2SeqLM,
@@ -19,10 +28,97 @@ try:
     LANGDETECT_AVAILABLE = True
 except ImportError:
     LANGDETECT_AVAILABLE = False
+
+# ONNX Runtime INT8 inference for encoder pipelines (optional, enabled with POLYDOC_ONNX=1)
+try:
+    from optimum.onnxruntime import ORTModelForQuestionAnswering, ORTModelForSequenceClassification, ORTQuantizer
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig
+    ONNX_RUNTIME_AVAILABLE = True
+except ImportError:
+    ONNX_RUNTIME_AVAILABLE = False
 from sentence_transformers import SentenceTransformer
 import numpy as np
 from dataclasses import dataclass
 
+# scikit-learn's English stop-word list (key phrases are scored without building a TfidfVectorizer)
+try:
+    from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS
+except ImportError:
+    ENGLISH_STOP_WORDS = frozenset()
+
+# Character-pattern heuristics for language detection
+_RU_RE = re.compile(r'[а-яё]', re.IGNORECASE)
+_ZH_RE = re.compile(r'[\u4e00-\u9fff]')
+_ES_RE = re.compile(r'[ñáéíóúü]', re.IGNORECASE)
+_FR_RE = re.compile(r'[àáâäçèéêëïîôöùúûüÿ]', re.IGNORECASE)
+
+# Same token pattern as scikit-learn's default word analyzer
+_TOKEN_RE = re.compile(r'(?u)\b\w\w+\b')
+
+def _key_phrase_scores(
+    sentences: List[str], max_features: int = 100, ngram_range: Tuple[int, int] = (1, 3), max_df: float = 0.7
+) -> Tuple[List[str], np.ndarray]:
+    """Mean L2-normalized TF-IDF score of each n-gram across sentences (TfidfVectorizer semantics)"""
+    min_n, max_n = ngram_range
+    sentence_counts = []
+    doc_freq = Counter()
+    term_freq = Counter()
+    for sentence in sentences:
+        tokens = [token for token in _TOKEN_RE.findall(sentence.lower()) if token not in ENGLISH_STOP_WORDS]
+        counts = Counter(
+            ' '.join(tokens[i:i + n]) for n in range(min_n, max_n + 1) for i in range(len(tokens) - n + 1)
+        )
+        sentence_counts.append(counts)
+        doc_freq.update(counts.keys())
+        term_freq.update(counts)
+    
+    # Drop terms that occur in too many sentences, then keep the most frequent ones
+    max_doc_count = max_df * len(sentences)
+    candidates = [term for term, freq in doc_freq.items() if freq <= max_doc_count]
+    features = sorted(candidates, key=lambda term: (-term_freq[term], term))[:max_features]
+    if not features:
+        return [], np.zeros(0)
+    
+    column = {term: j for j, term in enumerate(features)}
+    idf = np.log((1 + len(sentences)) / (1 + np.array([doc_freq[term] for term in features], dtype=np.float64))) + 1
+    scores = np.zeros(len(features))
+    for counts in sentence_counts:
+        cols = [column[term] for term in counts if term in column]
+        if not cols:
+            continue
+        weights = np.array([counts[features[j]] for j in cols], dtype=np.float64) * idf[cols]
+        scores[cols] += weights / np.linalg.norm(weights)
+    return features, scores / len(sentences)
+
+def _inference(model_fn, *args, **kwargs):
+    """Call a model without autograd tracking (inference_mode is per-thread, so it is entered at call time)"""
+    with torch.inference_mode():
+        return model_fn(*args, **kwargs)
+
+_SENTENCE_SPLIT_RE = re.compile(r'[.!?]+')
+
+def _split_sentences(text: str) -> List[str]:
+    """Split text into non-empty, stripped sentences"""
+    return [s.strip() for s in _SENTENCE_SPLIT_RE.split(text) if s.strip()]
+
+def _join_prefix(segments: Iterable[str], limit: int) -> str:
+    """Join text segments with spaces, stopping once the result reaches limit characters"""
+    parts = []
+    length = 0
+    for segment in segments:
+        parts.append(segment)
+        length += len(segment) + 1
+        if length >= limit:
+            break
+    return ' '.join(parts)
+
+def _readability_score(sentences: List[str]) -> float:
+    """Simple readability score based on sentence length (shorter sentences = higher readability)"""
+    if not sentences:
+        return 0
+    word_counts = np.fromiter((len(s.split()) for s in sentences), dtype=np.int32, count=len(sentences))
+    return float(max(0, min(100, 100 - (word_counts.mean() - 10) * 2)))
+
 @dataclass
 class ModelResponse:
     """Standard response format for AI model outputs"""
@@ -39,17 +135,28 @@ class AIModelManager:
         self.device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
         self.logger.info(f"Using device: {self.device}")
         
+        # Dedicated inference threads (torch and numpy release the GIL), sized so embeddings,
+        # summaries and sentiment can overlap without starving the default executor
+        self._executor = ThreadPoolExecutor(
+            max_workers=min(8, os.cpu_count() or 1), thread_name_prefix="polydoc-inference"
+        )
+        
+        # LRU cache of embeddings keyed by a hash of the text
+        self._emb_cache: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
+        self._emb_cache_size = 50_000
+        
+        # Per-instance language detection cache (a class-level lru_cache would pin every manager)
+        self._detect_language_impl = functools.lru_cache(maxsize=4096)(self._detect_language_uncached)
+        
         # Initialize models
         self._load_models()
     
     def _load_models(self):
         """Load required AI models with optimized loading and caching"""
         self.models_loaded = {'embedding': False, 'summarizer': False, 'qa': False, 'classifier': False, 'lang_detector': False}
+        self.lang_detector = None  # No neural language detector; detect_language uses script heuristics
         
         # Set optimizations for faster loading and proper caching
-        import os
-        import shutil
-        
         os.environ['TOKENIZERS_PARALLELISM'] = 'false'  # Avoid tokenizer warnings
         os.environ['HF_HUB_DISABLE_PROGRESS_BARS'] = '1'  # Disable progress bars
         os.environ['TRANSFORMERS_OFFLINE'] = '0'  # Allow online but prefer cache
@@ -79,12 +186,13 @@ class AIModelManager:
             # Use cached model with explicit caching to avoid re-downloads
             sentence_cache = os.path.expanduser('~/.cache/sentence-transformers')
             os.makedirs(sentence_cache, exist_ok=True)
+            os.environ.setdefault('SENTENCE_TRANSFORMERS_HOME', sentence_cache)
             
             # Try smaller model first if memory/disk is limited
             try:
                 self.embedding_model = SentenceTransformer(
                     'paraphrase-multilingual-MiniLM-L12-v2',
-                    device='cpu',
+                    device=str(self.device),
                     cache_folder=sentence_cache,
                     use_auth_token=False  # Avoid auth issues
                 )
@@ -97,7 +205,7 @@ class AIModelManager:
                     # Fallback to even smaller model
                     self.embedding_model = SentenceTransformer(
                         'all-MiniLM-L6-v2',
-                        device='cpu',
+                        device=str(self.device),
                         cache_folder=sentence_cache,
                         use_auth_token=False
                     )
@@ -111,6 +219,86 @@ class AIModelManager:
             self.logger.error(f"Failed to load embedding model: {e}")
             self.embedding_model = None
         
+        if self.embedding_model is not None:
+            self._quantize_embedding_model()
+        
+        # Summarization, QA and classification models are loaded on first use
+        # (see _ensure_model); POLYDOC_EAGER_MODELS=1 loads them at startup instead
+        self._cache_dir = cache_dir
+        self.summarizer = None
+        self.draft_summarizer = None  # Assistant model for speculative decoding (POLYDOC_ASSISTED_SUMMARY=1)
+        self.qa_model = None
+        self.classifier = None
+        self._model_locks = {}
+        self._models_attempted = set()
+        if os.getenv('POLYDOC_EAGER_MODELS', '0') == '1':
+            for name, loader in self._lazy_model_loaders().items():
+                loader()
+                self._models_attempted.add(name)
+        else:
+            self.logger.info("Summarization, QA and classification models will load on first use")
+        
+        try:
+            # Initialize translation models (on-demand loading)
+            self.logger.info("Initializing translation framework...")
+            self.translation_models = {}
+            # We'll load these on-demand to save startup time
+            self.models_loaded['translation'] = True
+            self.logger.info("✅ Translation framework ready (on-demand loading)")
+            
+        except Exception as e:
+            self.logger.error(f"Failed to initialize translation models: {e}")
+            self.translation_models = {}
+            self.models_loaded['translation'] = False
+        
+        # Initialize simple fallback models if main models failed
+        if not self.models_loaded['embedding']:
+            self.logger.warning("No embedding models loaded - initializing fallback text processing")
+            self.embedding_model = None
+            self._initialize_fallback_models()
+        
+        self._compile_models('embedding', *self._models_attempted)
+        
+        # Don't require embedding model to be critical - allow fallback operation
+        loaded_models = [k for k, v in self.models_loaded.items() if v]
+        self.logger.info(f"Models loaded successfully: {', '.join(loaded_models)}")
+        
+        if len(loaded_models) == 0:
+            self.logger.warning("No AI models loaded - using fallback text processing only")
+        else:
+            self.logger.info(f"✅ System ready with {len(loaded_models)} AI model(s)")
+    
+    def _is_cached(self, model_id: str) -> bool:
+        """Whether a model is already in the local cache, so loading can skip Hub metadata requests"""
+        try:
+            from huggingface_hub import try_to_load_from_cache
+            return isinstance(try_to_load_from_cache(model_id, 'config.json', cache_dir=self._cache_dir), str)
+        except Exception:
+            return False
+    
+    def _lazy_model_loaders(self) -> Dict[str, Any]:
+        """Loaders for the models that are deferred until first use, keyed by models_loaded name"""
+        return {
+            'summarizer': self._load_summarizer,
+            'qa': self._load_qa_model,
+            'classifier': self._load_classifier,
+        }
+    
+    async def _ensure_model(self, name: str):
+        """Load a deferred model once, off the event loop; concurrent callers wait on the same lock"""
+        if name in self._models_attempted:
+            return
+        lock = self._model_locks.setdefault(name, asyncio.Lock())
+        async with lock:
+            if name in self._models_attempted:
+                return
+            loop = asyncio.get_event_loop()
+            await loop.run_in_executor(None, self._lazy_model_loaders()[name])
+            self._compile_models(name)
+            self._models_attempted.add(name)
+    
+    def _load_summarizer(self):
+        """Load the summarization pipeline (with a lighter fallback model)"""
         try:
             # Optimized summarization model with faster loading
             self.logger.info("Loading summarization model (optimized)...")
@@ -121,19 +309,23 @@ class AIModelManager:
                 model_kwargs={
                     "torch_dtype": "float32", 
                     "low_cpu_mem_usage": True,
-                    "cache_dir": cache_dir,
-                    "local_files_only": False,  # Allow download if needed but prefer cache
+                    "cache_dir": self._cache_dir,
+                    "local_files_only": self._is_cached("facebook/bart-large-cnn"),
                     "force_download": False  # Never force re-download
                 },
                 tokenizer_kwargs={
                     "use_fast": True, 
                     "clean_up_tokenization_spaces": True,
-                    "cache_dir": cache_dir
+                    "cache_dir": self._cache_dir,
+                    "local_files_only": self._is_cached("facebook/bart-large-cnn")
                 }
             )
             self.models_loaded['summarizer'] = True
             self.logger.info("✅ Summarization model loaded successfully")
             
+            if os.getenv('POLYDOC_ASSISTED_SUMMARY', '0') == '1':
+                self._load_draft_summarizer()
+            
         except Exception as e:
             self.logger.error(f"Failed to load summarization model: {e}")
             # Fallback to lighter model
@@ -145,10 +337,11 @@ class AIModelManager:
                     device=-1,
                     model_kwargs={
                         "low_cpu_mem_usage": True,
-                        "cache_dir": cache_dir,
+                        "cache_dir": self._cache_dir,
+                        "local_files_only": self._is_cached("sshleifer/distilbart-cnn-12-6"),
                         "force_download": False
                     },
-                    tokenizer_kwargs={"cache_dir": cache_dir}
+                    tokenizer_kwargs={"cache_dir": self._cache_dir, "local_files_only": self._is_cached("sshleifer/distilbart-cnn-12-6")}
                 )
                 self.models_loaded['summarizer'] = True
                 self.logger.info("✅ Fallback summarization model loaded")
@@ -156,24 +349,71 @@ class AIModelManager:
                 self.logger.error(f"Fallback summarization model also failed: {e2}")
                 self.summarizer = None
         
+        if self.summarizer is not None:
+            self._quantize_summarizer()
+    
+    def _load_draft_summarizer(self):
+        """Load a small BART sharing bart-large-cnn's vocabulary to draft tokens for assisted generation"""
+        draft_model = "sshleifer/distilbart-cnn-6-6"
+        try:
+            self.draft_summarizer = AutoModelForSeq2SeqLM.from_pretrained(
+                draft_model,
+                low_cpu_mem_usage=True,
+                cache_dir=self._cache_dir,
+                local_files_only=self._is_cached(draft_model)
+            ).eval()
+            self.logger.info("✅ Draft summarization model loaded for assisted generation")
+        except Exception as e:
+            self.logger.warning(f"Draft summarization model unavailable, using plain decoding: {e}")
+            self.draft_summarizer = None
+    
+    def _summary_generate_kwargs(self) -> Dict[str, Any]:
+        """Extra generate() arguments for single-input summaries (assisted decoding when a draft is loaded)"""
+        if self.draft_summarizer is None:
+            return {}
+        # Assisted generation is greedy-only; bart-large-cnn's config defaults to num_beams=4
+        return {'assistant_model': self.draft_summarizer, 'num_beams': 1}
+    
+    def _quantize_summarizer(self):
+        """Apply dynamic INT8 quantization to the CPU summarizer's Linear layers (opt-in with POLYDOC_QUANTIZE=1)"""
+        if os.getenv('POLYDOC_QUANTIZE', '0') != '1':
+            return
+        
+        try:
+            # In place: the pipeline keeps its model reference and no FP32 copy is held alongside
+            torch.quantization.quantize_dynamic(
+                self.summarizer.model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True
+            )
+            self.logger.info("✅ Summarization model quantized to INT8")
+        except Exception as e:
+            self.logger.warning(f"Could not quantize summarization model, keeping FP32: {e}")
+    
+    def _load_qa_model(self):
+        """Load the question-answering pipeline (with a DistilBERT fallback)"""
         try:
             # Optimized QA model with better performance
             self.logger.info("Loading QA model (optimized)...")
-            self.qa_model = pipeline(
-                "question-answering",
-                model="deepset/roberta-base-squad2",
-                device=-1,
-                model_kwargs={
-                    "torch_dtype": "float32", 
-                    "low_cpu_mem_usage": True,
-                    "cache_dir": cache_dir,
-                    "force_download": False
-                },
-                tokenizer_kwargs={
-                    "use_fast": True,
-                    "cache_dir": cache_dir
-                }
+            self.qa_model = self._load_onnx_pipeline(
+                "question-answering", "deepset/roberta-base-squad2", self._cache_dir
             )
+            if self.qa_model is None:
+                self.qa_model = pipeline(
+                    "question-answering",
+                    model="deepset/roberta-base-squad2",
+                    device=-1,
+                    model_kwargs={
+                        "torch_dtype": "float32", 
+                        "low_cpu_mem_usage": True,
+                        "cache_dir": self._cache_dir,
+                        "local_files_only": self._is_cached("deepset/roberta-base-squad2"),
+                        "force_download": False
+                    },
+                    tokenizer_kwargs={
+                        "use_fast": True,
+                        "cache_dir": self._cache_dir,
+                        "local_files_only": self._is_cached("deepset/roberta-base-squad2")
+                    }
+                )
             self.models_loaded['qa'] = True
             self.logger.info("✅ QA model loaded successfully")
             
@@ -188,35 +428,44 @@ class AIModelManager:
                     device=-1,
                     model_kwargs={
                         "low_cpu_mem_usage": True,
-                        "cache_dir": cache_dir,
+                        "cache_dir": self._cache_dir,
+                        "local_files_only": self._is_cached("distilbert-base-cased-distilled-squad"),
                         "force_download": False
                     },
-                    tokenizer_kwargs={"cache_dir": cache_dir}
+                    tokenizer_kwargs={"cache_dir": self._cache_dir, "local_files_only": self._is_cached("distilbert-base-cased-distilled-squad")}
                 )
                 self.models_loaded['qa'] = True
                 self.logger.info("✅ Fallback QA model loaded")
             except Exception as e2:
                 self.logger.error(f"Fallback QA model also failed: {e2}")
                 self.qa_model = None
-        
+    
+    def _load_classifier(self):
+        """Load the sentiment classification pipeline"""
         try:
             # Optimized classification model
             self.logger.info("Loading classification model (optimized)...")
-            self.classifier = pipeline(
-                "text-classification",
-                model="nlptown/bert-base-multilingual-uncased-sentiment",
-                device=-1,
-                model_kwargs={
-                    "torch_dtype": "float32", 
-                    "low_cpu_mem_usage": True,
-                    "cache_dir": cache_dir,
-                    "force_download": False
-                },
-                tokenizer_kwargs={
-                    "use_fast": True,
-                    "cache_dir": cache_dir
-                }
+            self.classifier = self._load_onnx_pipeline(
+                "text-classification", "nlptown/bert-base-multilingual-uncased-sentiment", self._cache_dir
             )
+            if self.classifier is None:
+                self.classifier = pipeline(
+                    "text-classification",
+                    model="nlptown/bert-base-multilingual-uncased-sentiment",
+                    device=-1,
+                    model_kwargs={
+                        "torch_dtype": "float32", 
+                        "low_cpu_mem_usage": True,
+                        "cache_dir": self._cache_dir,
+                        "local_files_only": self._is_cached("nlptown/bert-base-multilingual-uncased-sentiment"),
+                        "force_download": False
+                    },
+                    tokenizer_kwargs={
+                        "use_fast": True,
+                        "cache_dir": self._cache_dir,
+                        "local_files_only": self._is_cached("nlptown/bert-base-multilingual-uncased-sentiment")
+                    }
+                )
             self.models_loaded['classifier'] = True
             self.logger.info("✅ Classification model loaded successfully")
             
@@ -224,64 +473,124 @@ class AIModelManager:
             self.logger.error(f"Failed to load classification model: {e}")
             # Skip classifier as it's not essential
             self.classifier = None
+    
+    def _load_onnx_pipeline(self, task: str, model_id: str, cache_dir: str):
+        """Build a pipeline backed by an INT8 ONNX Runtime model, exporting and quantizing it once"""
+        if not ONNX_RUNTIME_AVAILABLE or os.getenv('POLYDOC_ONNX', '0') != '1':
+            return None
+        
+        ort_class = ORTModelForQuestionAnswering if task == "question-answering" else ORTModelForSequenceClassification
+        onnx_dir = Path(os.path.expanduser('~/.cache/polydoc/onnx')) / model_id.replace('/', '--')
+        quantized_file = "model_quantized.onnx"
         
         try:
-            # Initialize translation models (on-demand loading)
-            self.logger.info("Initializing translation framework...")
-            self.translation_models = {}
-            # We'll load these on-demand to save startup time
-            self.models_loaded['translation'] = True
-            self.logger.info("✅ Translation framework ready (on-demand loading)")
+            if not (onnx_dir / quantized_file).exists():
+                self.logger.info(f"Exporting {model_id} to ONNX and quantizing to INT8 (one-time)...")
+                export_dir = onnx_dir / "fp32"
+                ort_class.from_pretrained(model_id, export=True, cache_dir=cache_dir).save_pretrained(export_dir)
+                AutoTokenizer.from_pretrained(model_id, use_fast=True, cache_dir=cache_dir).save_pretrained(onnx_dir)
+                ORTQuantizer.from_pretrained(export_dir).quantize(
+                    save_dir=onnx_dir,
+                    quantization_config=AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=False)
+                )
             
+            model = ort_class.from_pretrained(onnx_dir, file_name=quantized_file)
+            tokenizer = AutoTokenizer.from_pretrained(onnx_dir, use_fast=True)
+            self.logger.info(f"✅ Using ONNX Runtime INT8 model for {task}")
+            return pipeline(task, model=model, tokenizer=tokenizer)
         except Exception as e:
-            self.logger.error(f"Failed to initialize translation models: {e}")
-            self.translation_models = {}
-            self.models_loaded['translation'] = False
-        
-        # Initialize simple fallback models if main models failed
-        if not self.models_loaded['embedding']:
-            self.logger.warning("No embedding models loaded - initializing fallback text processing")
-            self.embedding_model = None
-            self._initialize_fallback_models()
+            self.logger.warning(f"ONNX Runtime model unavailable for {model_id}, using PyTorch: {e}")
+            return None
+    
+    def _quantize_embedding_model(self):
+        """Apply dynamic INT8 quantization to the embedding backbone on CPU (opt-in with POLYDOC_QUANTIZE=1)"""
+        # Quantized vectors drift from ones already stored, so enable this only on a fresh or re-embedded store
+        if self.device.type != 'cpu' or os.getenv('POLYDOC_QUANTIZE', '0') != '1':
+            return
         
-        # Don't require embedding model to be critical - allow fallback operation
-        loaded_models = [k for k, v in self.models_loaded.items() if v]
-        self.logger.info(f"Models loaded successfully: {', '.join(loaded_models)}")
+        try:
+            transformer = self.embedding_model[0]
+            transformer.auto_model = torch.quantization.quantize_dynamic(
+                transformer.auto_model, {torch.nn.Linear}, dtype=torch.qint8
+            )
+            self.logger.info("✅ Embedding model quantized to INT8")
+        except Exception as e:
+            self.logger.warning(f"Could not quantize embedding model, keeping FP32: {e}")
+    
+    def _compile_models(self, *names: str):
+        """Compile the named models' forwards with TorchDynamo (opt-in with POLYDOC_COMPILE=1)"""
+        if os.getenv('POLYDOC_COMPILE', '0') != '1' or not hasattr(torch, 'compile'):
+            return
         
-        if len(loaded_models) == 0:
-            self.logger.warning("No AI models loaded - using fallback text processing only")
-        else:
-            self.logger.info(f"✅ System ready with {len(loaded_models)} AI model(s)")
+        modules = {
+            'embedding': self.embedding_model[0].auto_model if self.embedding_model is not None else None,
+            'summarizer': getattr(self.summarizer, 'model', None),
+            'qa': getattr(self.qa_model, 'model', None),
+            'classifier': getattr(self.classifier, 'model', None),
+        }
+        for name in names:
+            module = modules.get(name)
+            # ONNX Runtime models and missing models have nothing to compile
+            if not isinstance(module, torch.nn.Module):
+                continue
+            try:
+                # Compile forward in place so generate() and pipeline type checks keep working
+                module.forward = torch.compile(module.forward, mode='reduce-overhead', dynamic=True)
+                self.logger.info(f"✅ Compiled {name} model with torch.compile")
+            except Exception as e:
+                self.logger.warning(f"torch.compile unavailable for {name} model: {e}")
     
     def _cleanup_cache(self, cache_dir: str):
         """Clean up incomplete downloads and old cache files"""
         try:
-            import os
-            import time
+            cutoff = time.time() - 30*24*3600
+            stale_files = []
+            for entry in self._scan_cache_files(cache_dir):
+                try:
+                    # One stat per file, served from the DirEntry cache where possible
+                    stat_result = entry.stat(follow_symlinks=False)
+                    # Remove incomplete downloads and very old cache files (older than 30 days)
+                    if entry.name.endswith(('.incomplete', '.tmp')) or stat_result.st_mtime < cutoff:
+                        stale_files.append((entry.path, stat_result.st_size))
+                except OSError:
+                    continue
             
             cleaned_size = 0
-            for root, dirs, files in os.walk(cache_dir):
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    try:
-                        # Remove incomplete downloads
-                        if file.endswith('.incomplete') or file.endswith('.tmp'):
-                            file_size = os.path.getsize(file_path)
-                            os.remove(file_path)
-                            cleaned_size += file_size
-                        # Remove very old cache files (older than 30 days)
-                        elif os.path.getmtime(file_path) < time.time() - 30*24*3600:
-                            file_size = os.path.getsize(file_path)
-                            os.remove(file_path)
-                            cleaned_size += file_size
-                    except Exception:
-                        continue
+            if stale_files:
+                # Unlink in parallel; the filesystem can service these concurrently
+                with ThreadPoolExecutor(max_workers=8) as executor:
+                    cleaned_size = sum(executor.map(self._safe_unlink, stale_files))
             
             if cleaned_size > 0:
                 self.logger.info(f"Cleaned up {cleaned_size / (1024*1024):.1f} MB of cache")
         except Exception as e:
             self.logger.warning(f"Cache cleanup failed: {e}")
     
+    @staticmethod
+    def _safe_unlink(stale_file) -> int:
+        """Remove a (path, size) cache entry and return the bytes freed"""
+        path, size = stale_file
+        try:
+            os.unlink(path)
+            return size
+        except OSError:
+            return 0
+    
+    def _scan_cache_files(self, directory: str):
+        """Yield DirEntry objects for every regular file below directory"""
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            yield from self._scan_cache_files(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            yield entry
+                    except OSError:
+                        continue
+        except OSError:
+            return
+    
     def _initialize_fallback_models(self):
         """Initialize simple fallback text processing when AI models fail"""
         try:
@@ -300,13 +609,41 @@ class AIModelManager:
                 self.logger.warning("Using fallback hash-based embeddings")
                 return self._create_fallback_embeddings(texts)
             
-            # Run embedding generation in thread pool to avoid blocking
-            loop = asyncio.get_event_loop()
-            embeddings = await loop.run_in_executor(
-                None, 
-                self.embedding_model.encode, 
-                texts
-            )
+            if not texts:
+                return np.zeros((0, self.embedding_model.get_sentence_embedding_dimension()), dtype=np.float32)
+            
+            # Only encode texts that are not already cached (each distinct text once)
+            keys = [hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest() for text in texts]
+            found = {key: self._emb_cache[key] for key in keys if key in self._emb_cache}
+            misses = {key: text for key, text in zip(keys, texts) if key not in found}
+            
+            if misses:
+                # Run embedding generation in thread pool to avoid blocking.
+                # encode() length-sorts inputs before batching, so fixed-size batches keep padding low
+                loop = asyncio.get_event_loop()
+                new_embeddings = await loop.run_in_executor(
+                    self._executor,
+                    functools.partial(
+                        _inference,
+                        self.embedding_model.encode,
+                        list(misses.values()),
+                        batch_size=64,
+                        device=str(self.device),
+                        convert_to_numpy=True,
+                        show_progress_bar=False
+                    )
+                )
+                found.update(zip(misses.keys(), new_embeddings))
+            
+            embeddings = np.stack([found[key] for key in keys])
+            
+            # Refresh LRU order and evict the oldest entries
+            for key in found:
+                self._emb_cache[key] = found[key]
+                self._emb_cache.move_to_end(key)
+            while len(self._emb_cache) > self._emb_cache_size:
+                self._emb_cache.popitem(last=False)
+            
             return embeddings
         except Exception as e:
             self.logger.warning(f"Embedding model failed: {e}, using fallback")
@@ -314,9 +651,6 @@ class AIModelManager:
     
     def _create_fallback_embeddings(self, texts: List[str]) -> np.ndarray:
         """Create simple hash-based embeddings when models fail"""
-        import hashlib
-        import numpy as np
-        
         embeddings = []
         for text in texts:
             # Create a simple hash-based embedding
@@ -332,83 +666,87 @@ class AIModelManager:
     
     async def summarize_text(
         self, 
-        text: str, 
+        text: Union[str, List[str]], 
         max_length: int = 150, 
         min_length: int = 50,
         language: str = 'en'
     ) -> ModelResponse:
-        """Summarize text using multilingual model with enhanced Indian language support"""
-        import time
+        """Summarize text (or a list of text segments) with enhanced Indian language support"""
         start_time = time.time()
         
+        # Segments (e.g. element texts) are tokenized one by one, so long documents never need joining
+        segments = [text] if isinstance(text, str) else list(text)
+        text_length = sum(len(segment) for segment in segments)
+        
         # Define Indian languages supported for bilingual summary
         indian_languages = {'hi', 'kn', 'mr', 'te', 'ta', 'bn', 'gu', 'pa', 'ml', 'or', 'as'}
         
+        if language not in indian_languages:
+            await self._ensure_model('summarizer')
+        
         # Enhanced fallback for Indian languages
         if not self.summarizer or language in indian_languages:
             # For Indian languages, create an extractive summary (safer approach)
-            return self._create_extractive_summary(text, language, max_length, start_time)
+            return self._create_extractive_summary(' '.join(segments), language, max_length, start_time)
         
         try:
             # Function to generate a single summary
-            def generate_single_summary(input_text, max_len, min_len):
+            def generate_single_summary(input_segments, max_len, min_len):
                 # For non-Indian languages, try the neural model
                 try:
-                    # Chunk text if too long (max ~1024 tokens)
-                    max_chunk_size = 800  # Reduced for better processing
-                    if len(input_text) > max_chunk_size:
+                    # Chunk on tokens, not characters, so windows match what the model sees
+                    token_windows = list(self._iter_token_windows(input_segments))
+                    if len(token_windows) > 1:
                         # For long texts, use extractive approach for Indian languages
                         if language in indian_languages:
-                            return self._extract_key_sentences(input_text, max_len)
-                        
-                        chunks = [input_text[i:i+max_chunk_size] for i in range(0, len(input_text), max_chunk_size)]
-                        chunk_summaries = []
+                            return self._extract_key_sentences(' '.join(input_segments), max_len)
                         
-                        for chunk in chunks:
-                            result = self.summarizer(
-                                chunk, 
-                                max_length=max_len//len(chunks), 
-                                min_length=max(10, min_len//len(chunks)),
-                                do_sample=False
-                            )
-                            chunk_summaries.append(result[0]['summary_text'])
+                        chunk_max = max(20, max_len // len(token_windows))
+                        chunk_min = min(max(10, min_len // len(token_windows)), chunk_max)
+                        chunk_summaries = self._summarize_token_windows(token_windows, chunk_max, chunk_min)
                         
                         # Combine chunk summaries
                         combined_summary = ' '.join(chunk_summaries)
                         
                         # Summarize the combined summaries if still too long
                         if len(combined_summary) > max_len * 2:
-                            final_result = self.summarizer(
+                            final_result = _inference(
+                                self.summarizer,
                                 combined_summary,
                                 max_length=max_len,
                                 min_length=min_len,
-                                do_sample=False
+                                do_sample=False,
+                                truncation=True,
+                                **self._summary_generate_kwargs()
                             )
                             return final_result[0]['summary_text']
                         else:
                             return combined_summary
                     else:
-                        result = self.summarizer(
-                            input_text,
+                        result = _inference(
+                            self.summarizer,
+                            ' '.join(input_segments),
                             max_length=max_len,
                             min_length=min_len,
-                            do_sample=False
+                            do_sample=False,
+                            truncation=True,
+                            **self._summary_generate_kwargs()
                         )
                         return result[0]['summary_text']
                 except Exception as e:
                     # Fallback to extractive summary if neural model fails
-                    return self._extract_key_sentences(input_text, max_len)
+                    return self._extract_key_sentences(' '.join(input_segments), max_len)
             
             # Generate primary summary in original language
-            primary_summary = generate_single_summary(text, max_length, min_length)
+            primary_summary = generate_single_summary(segments, max_length, min_length)
             
             # For Indian languages, generate bilingual summary
             if language in indian_languages:
                 # Generate English summary if original is in Indian language
                 try:
                     # Try to create an English version by prepending context
-                    english_context = f"Please summarize in English: {text[:500]}"
-                    english_summary = generate_single_summary(english_context, max_length, min_length)
+                    english_context = f"Please summarize in English: {_join_prefix(segments, 500)[:500]}"
+                    english_summary = generate_single_summary([english_context], max_length, min_length)
                     
                     # Combine both summaries with clear headers
                     language_names = {
@@ -429,7 +767,7 @@ class AIModelManager:
                         metadata={
                             'language': language,
                             'bilingual': True,
-                            'original_length': len(text),
+                            'original_length': text_length,
                             'supported_indian_language': True
                         },
                         processing_time=processing_time
@@ -449,7 +787,7 @@ class AIModelManager:
                         metadata={
                             'language': language,
                             'bilingual': False,
-                            'original_length': len(text),
+                            'original_length': text_length,
                             'bilingual_fallback': True
                         },
                         processing_time=processing_time
@@ -461,7 +799,7 @@ class AIModelManager:
             return ModelResponse(
                 content=primary_summary,
                 confidence=0.8,
-                metadata={'language': language, 'original_length': len(text), 'bilingual': False},
+                metadata={'language': language, 'original_length': text_length, 'bilingual': False},
                 processing_time=processing_time
             )
             
@@ -474,6 +812,44 @@ class AIModelManager:
                 processing_time=time.time() - start_time
             )
     
+    def _iter_token_windows(self, segments: Iterable[str], overlap_ratio: float = 0.1) -> Iterator[List[int]]:
+        """Tokenize text segments incrementally and yield model-sized windows with ~10% overlap"""
+        tokenizer = self.summarizer.tokenizer
+        # Leave room for the special tokens added around each window
+        window = min(tokenizer.model_max_length, self.summarizer.model.config.max_position_embeddings) - 2
+        overlap = int(window * overlap_ratio)
+        step = window - overlap
+        
+        buffer = []
+        yielded = False
+        for segment in segments:
+            # Segments were space-joined before; keep the leading space so word pieces match
+            prefix = ' ' if buffer or yielded else ''
+            buffer.extend(tokenizer(prefix + segment, add_special_tokens=False, truncation=False)['input_ids'])
+            # Only emit a window once more tokens follow it, so the final window is never a pure overlap
+            while len(buffer) > window:
+                yield buffer[:window]
+                yielded = True
+                buffer = buffer[step:]
+        
+        if not yielded or len(buffer) > overlap:
+            yield buffer
+    
+    def _summarize_token_windows(self, token_windows: List[List[int]], max_len: int, min_len: int, batch_size: int = 8) -> List[str]:
+        """Summarize token windows with batched generate calls instead of one pipeline call per chunk"""
+        tokenizer = self.summarizer.tokenizer
+        model = self.summarizer.model
+        summaries = []
+        for start in range(0, len(token_windows), batch_size):
+            batch = tokenizer.pad(
+                {'input_ids': [tokenizer.build_inputs_with_special_tokens(window) for window in token_windows[start:start + batch_size]]},
+                return_tensors='pt'
+            ).to(model.device)
+            with torch.inference_mode():
+                output_ids = model.generate(**batch, max_length=max_len, min_length=min_len, do_sample=False)
+            summaries.extend(tokenizer.batch_decode(output_ids, skip_special_tokens=True, clean_up_tokenization_spaces=True))
+        return summaries
+    
     async def answer_question(
         self, 
         question: str, 
@@ -481,12 +857,13 @@ class AIModelManager:
         language: str = 'en'
     ) -> ModelResponse:
         """Answer question based on document context with multilingual support for Indian languages"""
-        import time
         start_time = time.time()
         
         # Define Indian languages supported for bilingual responses
         indian_languages = {'hi', 'kn', 'mr', 'te', 'ta', 'bn', 'gu', 'pa', 'ml', 'or', 'as'}
         
+        await self._ensure_model('qa')
+        
         # Fallback if QA model not loaded
         if not self.qa_model:
             # Provide a more contextual fallback response
@@ -529,34 +906,19 @@ class AIModelManager:
                 try:
                     enhanced_question = f"Based on the provided content, {question.lower()}"
                     
-                    # Use shorter context chunks for better QA performance
-                    max_context_length = 1500
-                    if len(context) > max_context_length:
-                        # Find the most relevant chunk
-                        stride = max_context_length // 2
-                        chunks = []
-                        for i in range(0, len(context), stride):
-                            chunks.append(context[i:i+max_context_length])
-                        
-                        best_answer = None
-                        best_score = 0
-                        
-                        for chunk in chunks:
-                            try:
-                                result = self.qa_model(question=enhanced_question, context=chunk)
-                                if result['score'] > best_score:
-                                    best_score = result['score']
-                                    best_answer = result
-                            except Exception:
-                                continue
-                        
-                        if best_answer:
-                            qa_answer = best_answer['answer']
-                            qa_confidence = best_score
-                    else:
-                        result = self.qa_model(question=enhanced_question, context=context)
-                        qa_answer = result['answer']
-                        qa_confidence = result['score']
+                    # Let the pipeline split long contexts into overlapping token windows
+                    # (return_overflowing_tokens) and score them in batched forward passes;
+                    # it returns the best span across all windows
+                    result = _inference(
+                        self.qa_model,
+                        question=enhanced_question,
+                        context=context,
+                        max_seq_len=384,
+                        doc_stride=128,
+                        batch_size=16
+                    )
+                    qa_answer = result['answer']
+                    qa_confidence = result['score']
                         
                 except Exception as qa_error:
                     self.logger.warning(f"QA model error: {qa_error}")
@@ -572,7 +934,6 @@ class AIModelManager:
                 response_parts.append(f"\n\n{qa_answer}")
             
             # Extract relevant context sentences to provide more comprehensive info
-            import re
             sentences = re.split(r'[.!?]+', context)
             sentences = [s.strip() for s in sentences if s.strip() and len(s.strip()) > 20]
             
@@ -689,8 +1050,6 @@ class AIModelManager:
     def _extract_key_sentences(self, text: str, max_length: int) -> str:
         """Extract key sentences for summarization"""
         try:
-            import re
-            
             # Split into sentences
             sentences = re.split(r'[.!?।]+', text)
             sentences = [s.strip() for s in sentences if s.strip() and len(s.strip()) > 10]
@@ -717,8 +1076,6 @@ class AIModelManager:
     def _format_response(self, response: str) -> str:
         """Format AI response for better readability"""
         try:
-            import re
-            
             # Clean up the response
             formatted = response.strip()
             
@@ -774,38 +1131,79 @@ class AIModelManager:
             if not text.strip():
                 return 'unknown'
             
-            # Fallback if language detector is disabled
-            if not self.lang_detector:
-                # Simple heuristic fallback - detect based on character patterns
-                import re
-                if re.search(r'[а-яё]', text.lower()):
-                    return 'ru'
-                elif re.search(r'[中文汉语]', text):
-                    return 'zh'
-                elif re.search(r'[ñáéíóúü]', text.lower()):
-                    return 'es'
-                elif re.search(r'[àáâäçèéêëïîôöùúûüÿ]', text.lower()):
-                    return 'fr'
-                else:
-                    return 'en'  # Default to English
-            
             # Use first 500 characters for language detection
             sample_text = text[:500]
-            result = self.lang_detector(sample_text)
             
-            if result and len(result) > 0:
-                return result[0]['label'].lower()
-            else:
-                return 'unknown'
+            # Heuristic fallback is cheap enough to run inline
+            if not self.lang_detector:
+                return self._detect_language_impl(sample_text)
+            
+            loop = asyncio.get_event_loop()
+            return await loop.run_in_executor(self._executor, self._detect_language_impl, sample_text)
                 
         except Exception as e:
             self.logger.error(f"Error in language detection: {e}")
             return 'en'  # Default to English on error
     
+    async def detect_languages_batch(self, texts: List[str]) -> List[str]:
+        """Detect the language of many texts at once (one detector call for the whole list)"""
+        languages = ['unknown'] * len(texts)
+        indices = [i for i, text in enumerate(texts) if text.strip()]
+        try:
+            if not self.lang_detector:
+                for i in indices:
+                    languages[i] = self._detect_language_impl(texts[i][:500])
+                return languages
+            
+            # Use first 500 characters of each text; repeated samples (headers, table cells)
+            # are classified once, padded into batches by the pipeline
+            samples = [texts[i][:500] for i in indices]
+            unique_samples = list(dict.fromkeys(samples))
+            results = _inference(self.lang_detector, unique_samples, batch_size=32)
+            labels = {sample: result['label'].lower() for sample, result in zip(unique_samples, results)}
+            for i, sample in zip(indices, samples):
+                languages[i] = labels[sample]
+            return languages
+        
+        except Exception as e:
+            self.logger.error(f"Error in batch language detection: {e}")
+            return ['en' if text.strip() else 'unknown' for text in texts]
+    
+    def _detect_language_uncached(self, text_sample: str) -> str:
+        """Detect the language of a text sample (wrapped by the _detect_language_impl cache)"""
+        if not self.lang_detector:
+            return self._detect_language_heuristic(text_sample)
+        
+        result = _inference(self.lang_detector, text_sample)
+        if result and len(result) > 0:
+            return result[0]['label'].lower()
+        else:
+            return 'unknown'
+    
+    def _detect_language_heuristic(self, text: str) -> str:
+        """Simple heuristic fallback - detect based on character patterns"""
+        sample = text[:500]
+        if _RU_RE.search(sample):
+            return 'ru'
+        elif _ZH_RE.search(sample):
+            return 'zh'
+        elif _ES_RE.search(sample):
+            return 'es'
+        elif _FR_RE.search(sample):
+            return 'fr'
+        else:
+            return 'en'  # Default to English
+    
     async def analyze_sentiment(self, text: str) -> Dict[str, Any]:
         """Analyze sentiment of text"""
+        await self._ensure_model('classifier')
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(self._executor, self._analyze_sentiment_sync, text)
+    
+    def _analyze_sentiment_sync(self, text: str) -> Dict[str, Any]:
+        """Run the sentiment classifier (blocking)"""
         try:
-            result = self.classifier(text[:500])  # Limit text length
+            result = _inference(self.classifier, text[:500])  # Limit text length
             
             return {
                 'sentiment': result[0]['label'],
@@ -822,38 +1220,30 @@ class AIModelManager:
                 'error': str(e)
             }
     
-    async def extract_key_phrases(self, text: str, top_k: int = 5) -> List[str]:
-        """Extract key phrases from text using simple TF-IDF approach"""
+    async def extract_key_phrases(self, text: str, top_k: int = 5, sentences: Optional[List[str]] = None) -> List[str]:
+        """Extract key phrases from text using simple TF-IDF approach (pass sentences if already split)"""
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(self._executor, self._extract_key_phrases_sync, text, top_k, sentences)
+    
+    def _extract_key_phrases_sync(self, text: str, top_k: int, sentences: Optional[List[str]] = None) -> List[str]:
+        """Score and select key phrases (blocking)"""
         try:
-            from sklearn.feature_extraction.text import TfidfVectorizer
-            from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS
-            import re
-            
             # Simple preprocessing
-            sentences = re.split(r'[.!?]+', text)
-            sentences = [s.strip() for s in sentences if s.strip()]
+            if sentences is None:
+                sentences = _split_sentences(text)
             
             if len(sentences) < 2:
                 return [text[:50]] if text else []
             
-            # Create TF-IDF vectorizer
-            vectorizer = TfidfVectorizer(
-                max_features=100,
-                stop_words='english',
-                ngram_range=(1, 3),
-                max_df=0.7,
-                min_df=1
-            )
-            
-            # Fit and transform
-            tfidf_matrix = vectorizer.fit_transform(sentences)
-            feature_names = vectorizer.get_feature_names_out()
-            
-            # Get average TF-IDF scores
-            mean_scores = np.mean(tfidf_matrix.toarray(), axis=0)
+            # Get average TF-IDF scores of the top 1-3 word n-grams
+            feature_names, mean_scores = _key_phrase_scores(sentences)
             
-            # Get top phrases
-            top_indices = np.argsort(mean_scores)[-top_k:][::-1]
+            # Get top phrases: partial selection, then order only the k winners
+            k = min(top_k, mean_scores.size)
+            if k == 0:
+                return []
+            top_indices = np.argpartition(-mean_scores, k - 1)[:k]
+            top_indices = top_indices[np.argsort(-mean_scores[top_indices])]
             key_phrases = [feature_names[i] for i in top_indices if mean_scores[i] > 0]
             
             return key_phrases
@@ -885,8 +1275,6 @@ class AIModelManager:
     
     async def _detect_by_characters(self, text: str) -> str:
         """Detect language based on character patterns"""
-        import re
-        
         # Count different script characters
         latin_chars = sum(1 for c in text if c.isascii() and c.isalpha())
         arabic_chars = sum(1 for c in text if '\u0600' <= c <= '\u06FF')
@@ -925,7 +1313,6 @@ class AIModelManager:
     
     async def translate_text(self, text: str, source_lang: str, target_lang: str) -> ModelResponse:
         """Translate text from source language to target language"""
-        import time
         start_time = time.time()
         
         try:
@@ -971,7 +1358,7 @@ class AIModelManager:
                 
                 translated_chunks = []
                 for chunk in chunks:
-                    result = translator(chunk)
+                    result = _inference(translator, chunk)
                     if isinstance(result, list) and len(result) > 0:
                         translated_chunks.append(result[0]['translation_text'])
                     else:
@@ -979,7 +1366,7 @@ class AIModelManager:
                 
                 translated_text = ' '.join(translated_chunks)
             else:
-                result = translator(text)
+                result = _inference(translator, text)
                 if isinstance(result, list) and len(result) > 0:
                     translated_text = result[0]['translation_text']
                 else:
@@ -1079,8 +1466,6 @@ class AIModelManager:
                 }
             
             # Simple extractive approach
-            import re
-            
             # Split into sentences using multiple delimiters
             sentences = re.split(r'[.!?।\n]+', text)
             sentences = [s.strip() for s in sentences if s.strip() and len(s.strip()) > 10]
@@ -1170,6 +1555,9 @@ class AIModelManager:
 class DocumentAnalyzer:
     """Specialized class for document-level analysis"""
     
+    # Text handed to the extractive dual-language summary (it keeps at most the first 5 sentences)
+    _SUMMARY_PREFIX_CHARS = 20_000
+    
     def __init__(self, ai_models: AIModelManager):
         self.ai_models = ai_models
         self.logger = logging.getLogger(__name__)
@@ -1187,43 +1575,30 @@ class DocumentAnalyzer:
                 'structure_quality': 'good'
             }
             
-            all_text = []
+            # Count element types
+            analysis['element_types'] = dict(Counter(element.element_type for element in elements))
             
-            for element in elements:
-                # Count element types
-                elem_type = element.element_type
-                analysis['element_types'][elem_type] = \
-                    analysis['element_types'].get(elem_type, 0) + 1
-                
-                # Collect all text
-                if element.text.strip():
-                    all_text.append(element.text)
-                    
-                    # Detect language for each element
-                    lang = await self.ai_models.detect_language(element.text)
-                    analysis['languages_detected'][lang] = \
-                        analysis['languages_detected'].get(lang, 0) + 1
+            # Collect all text and detect languages for every element in one batch
+            all_text = [element.text for element in elements if element.text.strip()]
+            languages = await self.ai_models.detect_languages_batch(all_text)
+            analysis['languages_detected'] = dict(Counter(languages))
             
             # Analyze combined text
             if all_text:
                 combined_text = ' '.join(all_text)
+                sentences = _split_sentences(combined_text)
                 
-                # Extract key topics
-                analysis['key_topics'] = await self.ai_models.extract_key_phrases(
-                    combined_text, top_k=10
+                # Key topics, sentiment and readability are independent; run them concurrently
+                loop = asyncio.get_event_loop()
+                (
+                    analysis['key_topics'],
+                    analysis['sentiment_analysis'],
+                    analysis['readability_score']
+                ) = await asyncio.gather(
+                    self.ai_models.extract_key_phrases(combined_text, top_k=10, sentences=sentences),
+                    self.ai_models.analyze_sentiment(combined_text),
+                    loop.run_in_executor(self.ai_models._executor, _readability_score, sentences)
                 )
-                
-                # Sentiment analysis
-                analysis['sentiment_analysis'] = await self.ai_models.analyze_sentiment(
-                    combined_text
-                )
-                
-                # Simple readability score based on sentence length
-                sentences = combined_text.split('.')
-                if sentences:
-                    avg_sentence_length = sum(len(s.split()) for s in sentences) / len(sentences)
-                    # Simple score: shorter sentences = higher readability
-                    analysis['readability_score'] = max(0, min(100, 100 - (avg_sentence_length - 10) * 2))
             
             return analysis
             
@@ -1274,7 +1649,8 @@ class DocumentAnalyzer:
                     'translation_needed': False
                 }
             
-            combined_text = ' '.join(all_text)
+            # The full text is never joined: detection and the extractive summary only read the
+            # opening of the document, and summarize_text tokenizes the segments one by one
             
             # Detect primary language
             primary_language = 'en'  # Default
@@ -1282,7 +1658,7 @@ class DocumentAnalyzer:
                 primary_language = max(languages_found, key=languages_found.get)
             else:
                 # Fallback detection
-                primary_language = await self.ai_models.detect_language_advanced(combined_text)
+                primary_language = await self.ai_models.detect_language_advanced(_join_prefix(all_text, 1000))
             
             # Create document type analysis
             document_type = self._determine_document_type(element_types_found)
@@ -1290,7 +1666,7 @@ class DocumentAnalyzer:
             # Generate dual-language summary if requested
             if dual_language:
                 summary_result = await self.ai_models.generate_dual_language_summary(
-                    combined_text, primary_language
+                    _join_prefix(all_text, self._SUMMARY_PREFIX_CHARS), primary_language
                 )
                 
                 # Create structured document information based on document type
@@ -1323,19 +1699,23 @@ class DocumentAnalyzer:
                 config = length_configs.get(summary_length, length_configs['medium'])
                 
                 summary_response = await self.ai_models.summarize_text(
-                    combined_text,
+                    all_text,
                     max_length=config['max_length'],
                     min_length=config['min_length'],
                     language=primary_language
                 )
                 
-                # Add page information
-                summary_with_pages = f"{summary_response.content}\n\n"
-                summary_with_pages += f"Document contains {len(page_info)} page(s) with content distributed across:\n"
+                # Add page information (collect parts and join once)
+                summary_parts = [
+                    f"{summary_response.content}\n\n",
+                    f"Document contains {len(page_info)} page(s) with content distributed across:\n"
+                ]
                 
                 for page_num in sorted(page_info.keys()):
                     content_preview = ' '.join(page_info[page_num])[:100] + "..."
-                    summary_with_pages += f"Page {page_num}: {content_preview}\n"
+                    summary_parts.append(f"Page {page_num}: {content_preview}\n")
+                
+                summary_with_pages = ''.join(summary_parts)
                 
                 return {
                     'summary': summary_with_pages,
@@ -1460,9 +1840,6 @@ class DocumentAnalyzer:
     def _create_extractive_summary(self, text: str, language: str, max_length: int, start_time: float) -> ModelResponse:
         """Create extractive summary for Indian languages (safer approach)"""
         try:
-            import re
-            import time
-            
             # Clean and split into sentences
             sentences = re.split(r'[.!?।]+', text)
             sentences = [s.strip() for s in sentences if s.strip() and len(s.strip()) > 10]
@@ -1565,8 +1942,6 @@ class DocumentAnalyzer:
     def _extract_key_sentences(self, text: str, max_length: int) -> str:
         """Extract key sentences for summarization"""
         try:
-            import re
-            
             # Split into sentences
             sentences = re.split(r'[.!?।]+', text)
             sentences = [s.strip() for s in sentences if s.strip() and len(s.strip()) > 10]
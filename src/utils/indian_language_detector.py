@@ -4,14 +4,65 @@ Specialized language detection for Indian languages with improved accuracy
 """
 
 import logging
+import os
 import re
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
-from langdetect import detect, detect_langs, LangDetectException
+import numpy as np
+from langdetect import detect, LangDetectException
+from langdetect.detector_factory import DetectorFactory, PROFILES_DIRECTORY
 import unicodedata
 
+# fastText language identification (optional, fast path for detect_multiple_languages)
+try:
+    from fast_langdetect import detect_multilingual as fast_detect_multilingual
+    FAST_LANGDETECT_AVAILABLE = True
+except ImportError:
+    fast_detect_multilingual = None
+    FAST_LANGDETECT_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Every code point str.isspace() accepts (none lie above U+3000)
+_WHITESPACE_CODEPOINTS = np.array([cp for cp in range(0x3001) if chr(cp).isspace()], dtype=np.uint32)
+
+# Patterns used by _clean_text_for_detection, compiled once
+_URL_RE = re.compile(r'http[s]?://\S+')
+_EMAIL_RE = re.compile(r'\S+@\S+\.\S+')
+_DIGITS_RE = re.compile(r'\d+')
+_NON_WORD_RE = re.compile(r'[^\w\s]')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# langdetect profiles worth loading: the languages we report plus close script neighbours
+# (langdetect ships no Odia/Assamese profiles; those come from the script fallback)
+LANGDETECT_LANGUAGES = (
+    'en', 'hi', 'kn', 'mr', 'te', 'ta', 'bn', 'gu', 'pa', 'ml', 'ne', 'ur', 'ar', 'zh-cn'
+)
+
+# Private langdetect factory holding only LANGDETECT_LANGUAGES (the global one loads all 55)
+_langdetect_factory: Optional[DetectorFactory] = None
+
+def _get_langdetect_factory() -> DetectorFactory:
+    """Build the subset langdetect factory on first use"""
+    global _langdetect_factory
+    if _langdetect_factory is None:
+        profiles = []
+        for lang in LANGDETECT_LANGUAGES:
+            with open(os.path.join(PROFILES_DIRECTORY, lang), encoding='utf-8') as f:
+                profiles.append(f.read())
+        factory = DetectorFactory()
+        factory.load_json_profile(profiles)
+        factory.set_seed(0)  # For consistent results
+        _langdetect_factory = factory
+    return _langdetect_factory
+
+def _detect_langs(text: str):
+    """detect_langs() against the subset factory"""
+    detector = _get_langdetect_factory().create()
+    detector.append(text)
+    return detector.get_probabilities()
+
 @dataclass
 class LanguageDetection:
     """Language detection result with confidence and metadata"""
@@ -122,48 +173,49 @@ class IndianLanguageDetector:
         """Initialize the Indian language detector"""
         logger.info("Initializing Indian Language Detector...")
         
+        # Sorted range table so _get_script_composition can classify code points with one searchsorted
+        self._script_names = tuple(self.SCRIPT_RANGES) + ('Other',)
+        ranges = sorted(
+            (start, end, script_id)
+            for script_id, script in enumerate(self.SCRIPT_RANGES)
+            for start, end in self.SCRIPT_RANGES[script]
+        )
+        self._range_starts = np.array([r[0] for r in ranges], dtype=np.uint32)
+        self._range_ends = np.array([r[1] for r in ranges], dtype=np.uint32)
+        self._range_scripts = np.array([r[2] for r in ranges], dtype=np.int64)
+        
     def _get_script_composition(self, text: str) -> Dict[str, float]:
         """Analyze the script composition of the text"""
         if not text:
             return {}
-            
-        script_counts = {}
-        total_chars = 0
-        
-        for char in text:
-            # Skip whitespace but include punctuation for better analysis
-            if char.isspace():
-                continue
-                
-            # Count all non-space characters
-            total_chars += 1
-            char_code = ord(char)
-            
-            # Find which script this character belongs to
-            script_found = False
-            for script, ranges in self.SCRIPT_RANGES.items():
-                for start, end in ranges:
-                    if start <= char_code <= end:
-                        script_counts[script] = script_counts.get(script, 0) + 1
-                        script_found = True
-                        break
-                if script_found:
-                    break
-            
-            # If character doesn't match any known script, count as 'Other'
-            if not script_found and char.isalnum():
-                script_counts['Other'] = script_counts.get('Other', 0) + 1
         
+        # Skip whitespace but include punctuation for better analysis
+        codepoints = np.frombuffer(text.encode('utf-32-le', 'surrogatepass'), dtype=np.uint32)
+        codepoints = codepoints[~np.isin(codepoints, _WHITESPACE_CODEPOINTS)]
+        total_chars = codepoints.size
         if total_chars == 0:
             return {}
-            
-        # Convert counts to percentages
-        script_percentages = {
-            script: count / total_chars 
-            for script, count in script_counts.items()
-        }
         
-        return script_percentages
+        # Find which script range each character falls in (-1 for none)
+        range_index = np.maximum(np.searchsorted(self._range_starts, codepoints, side='right') - 1, 0)
+        in_range = (codepoints >= self._range_starts[range_index]) & (codepoints <= self._range_ends[range_index])
+        script_ids = np.where(in_range, self._range_scripts[range_index], -1)
+        
+        # If character doesn't match any known script, count as 'Other' when alphanumeric
+        unmatched = np.flatnonzero(script_ids < 0)
+        if unmatched.size:
+            alnum = np.fromiter(
+                (chr(cp).isalnum() for cp in codepoints[unmatched].tolist()), dtype=bool, count=unmatched.size
+            )
+            script_ids[unmatched[alnum]] = len(self._script_names) - 1
+        
+        # Convert counts to percentages, keyed in order of first appearance
+        ids, first_seen, counts = np.unique(script_ids, return_index=True, return_counts=True)
+        return {
+            self._script_names[script_id]: count / total_chars
+            for _, script_id, count in sorted(zip(first_seen.tolist(), ids.tolist(), counts.tolist()))
+            if script_id >= 0
+        }
     
     def _script_to_language(self, script: str, confidence: float) -> Optional[LanguageDetection]:
         """Map script to most likely language"""
@@ -206,13 +258,13 @@ class IndianLanguageDetector:
             return ""
             
         # Remove URLs, emails, numbers, and special characters
-        cleaned = re.sub(r'http[s]?://\S+', '', text)
-        cleaned = re.sub(r'\S+@\S+\.\S+', '', cleaned)
-        cleaned = re.sub(r'\d+', '', cleaned)
-        cleaned = re.sub(r'[^\w\s]', ' ', cleaned)
+        cleaned = _URL_RE.sub('', text)
+        cleaned = _EMAIL_RE.sub('', cleaned)
+        cleaned = _DIGITS_RE.sub('', cleaned)
+        cleaned = _NON_WORD_RE.sub(' ', cleaned)
         
         # Remove extra whitespace
-        cleaned = re.sub(r'\s+', ' ', cleaned).strip()
+        cleaned = _WHITESPACE_RE.sub(' ', cleaned).strip()
         
         return cleaned
         
@@ -232,7 +284,7 @@ class IndianLanguageDetector:
         
         # Method 1: Try langdetect first for supported languages
         try:
-            detected_langs = detect_langs(cleaned_text)
+            detected_langs = _detect_langs(cleaned_text)
             
             # Filter to only Indian languages and English
             indian_langs = [
@@ -307,9 +359,33 @@ class IndianLanguageDetector:
         """
         results = []
         
+        # fastText scores the whole text in native code; langdetect below is the fallback
+        if FAST_LANGDETECT_AVAILABLE:
+            try:
+                # fastText predicts one line at a time; the default lite model is the one
+                # document_processor's detect() already holds, so no second model is loaded
+                candidates = fast_detect_multilingual(text.replace('\n', ' '), k=5)
+                for candidate in candidates:
+                    lang, score = candidate['lang'], candidate['score']
+                    if score >= threshold and lang in self.INDIAN_LANGUAGES:
+                        lang_info = self.INDIAN_LANGUAGES[lang]
+                        results.append(LanguageDetection(
+                            language_code=lang,
+                            language_name=lang_info['name'],
+                            native_name=lang_info['native_name'],
+                            confidence=score,
+                            script=lang_info['script'],
+                            family=lang_info['family']
+                        ))
+                if results:
+                    results.sort(key=lambda x: x.confidence, reverse=True)
+                    return results
+            except Exception as e:
+                logger.debug(f"fast-langdetect failed, falling back to langdetect: {e}")
+        
         try:
             # Get all language probabilities
-            lang_probs = detect_langs(text)
+            lang_probs = _detect_langs(text)
             
             # Filter to only Indian languages and English, above threshold
             for prob in lang_probs:
@@ -362,9 +438,19 @@ def get_indian_language_detector() -> IndianLanguageDetector:
         _detector_instance = IndianLanguageDetector()
     return _detector_instance
 
+# Snippets up to this length are memoized; document elements repeat headers, labels, etc.
+_CACHED_TEXT_LIMIT = 1024
+
+@lru_cache(maxsize=4096)
+def _detect_short_text(text: str) -> LanguageDetection:
+    """Memoized detection for short snippets (langdetect is seeded, so results are stable)"""
+    return get_indian_language_detector().detect_language(text)
+
 # Convenience functions
 def detect_indian_language(text: str) -> LanguageDetection:
     """Detect Indian language in text"""
+    if text and len(text) <= _CACHED_TEXT_LIMIT:
+        return _detect_short_text(text)
     detector = get_indian_language_detector()
     return detector.detect_language(text)
 
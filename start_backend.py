@@ -36,10 +36,11 @@ def main():
         logger.info("✅ OCR and language detection initialized")
         
         # Create necessary directories
-        os.makedirs("uploads", exist_ok=True)
-        os.makedirs("static", exist_ok=True)
-        os.makedirs("templates", exist_ok=True)
-        os.makedirs("vector_store", exist_ok=True)
+        with os.scandir('.') as entries:
+            existing = {entry.name for entry in entries if entry.is_dir()}
+        for directory in ("uploads", "static", "templates", "vector_store"):
+            if directory not in existing:
+                os.makedirs(directory, exist_ok=True)
         
         logger.info("✅ Required directories created")
         
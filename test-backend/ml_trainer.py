@@ -13,6 +13,7 @@ using CSV datasets. It includes functionality for:
 import pandas as pd
 import numpy as np
 import asyncio
+import functools
 import logging
 import json
 import time
@@ -72,6 +73,12 @@ except ImportError as e:
     DocumentProcessor = MockDocumentProcessor
     IndianLanguageDetector = MockIndianLanguageDetector
 
+@functools.lru_cache(maxsize=1)
+def _shared_models() -> Tuple[Any, Any, Any]:
+    """Load the AI components once per process; every framework instance reuses them"""
+    ai_models = AIModelManager()
+    return ai_models, DocumentAnalyzer(ai_models), DocumentProcessor()
+
 class MLTrainingFramework:
     """Main framework for training, testing, and validating PolyDoc AI models"""
     
@@ -113,9 +120,7 @@ class MLTrainingFramework:
             else:
                 self.logger.info("Initializing mock AI models for testing...")
             
-            self.ai_models = AIModelManager()
-            self.document_analyzer = DocumentAnalyzer(self.ai_models)
-            self.document_processor = DocumentProcessor()
+            self.ai_models, self.document_analyzer, self.document_processor = _shared_models()
             
             if MODELS_AVAILABLE:
                 self.logger.info("PolyDoc AI models initialized successfully")
@@ -12,17 +12,24 @@ import os
 from pathlib import Path
 import venv
 
-def run_command(cmd, description=""):
-    """Run a command and return success status"""
+def run_command(argv, description="", show_output=True):
+    """Run a command (given as an argv list) and return success status"""
+    cmd = ' '.join(str(arg) for arg in argv)
     try:
         if description:
             print(f"🔧 {description}")
         
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
+        # Discard stdout when it won't be shown; stderr is still kept for failures
+        result = subprocess.run(
+            [str(arg) for arg in argv],
+            stdout=subprocess.PIPE if show_output else subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True
+        )
         
         if result.returncode == 0:
             print(f"✅ Success: {description or cmd}")
-            if result.stdout.strip():
+            if show_output and result.stdout.strip():
                 print(f"   Output: {result.stdout.strip()}")
             return True
         else:
@@ -67,6 +74,35 @@ def create_virtual_environment():
         print(f"❌ Failed to create virtual environment: {e}")
         return False
 
+def requirements_satisfied(requirements_file):
+    """Check whether every requirement is already installed, without invoking pip"""
+    try:
+        from importlib.metadata import version, PackageNotFoundError
+        from packaging.requirements import Requirement
+    except ImportError:
+        return False  # Can't verify locally; let pip decide
+    
+    try:
+        with open(requirements_file, encoding="utf-8") as f:
+            for line in f:
+                line = line.split('#', 1)[0].strip()
+                if not line:
+                    continue
+                req = Requirement(line)
+                if req.marker is not None and not req.marker.evaluate():
+                    continue  # Not for this platform/interpreter
+                if req.extras:
+                    return False  # Extras' dependencies aren't checked here; let pip decide
+                try:
+                    installed = version(req.name)
+                except PackageNotFoundError:
+                    return False
+                if not req.specifier.contains(installed, prereleases=True):
+                    return False
+        return True
+    except Exception:
+        return False
+
 def install_dependencies():
     """Install required dependencies"""
     print("📦 Installing dependencies...")
@@ -76,9 +112,15 @@ def install_dependencies():
         print("❌ requirements.txt not found")
         return False
     
+    # Warm runs: skip pip's resolver entirely when nothing needs installing
+    if requirements_satisfied(requirements_file):
+        print("✅ All requirements already satisfied, skipping pip")
+        return True
+    
     return run_command(
-        f'pip install -r "{requirements_file}"',
-        "Installing Python packages"
+        [sys.executable, "-m", "pip", "install", "--no-input", "--prefer-binary", "-r", requirements_file],
+        "Installing Python packages",
+        show_output=False
     )
 
 def run_framework_test():
@@ -91,7 +133,7 @@ def run_framework_test():
         return False
     
     return run_command(
-        f'python "{test_script}"',
+        [sys.executable, test_script],
         "Running framework test"
     )
 
@@ -106,7 +148,7 @@ def run_basic_ml_test():
     
     # First try with mock mode to see if basic functionality works
     return run_command(
-        f'python "{run_tests_script}" --test basic',
+        [sys.executable, run_tests_script, "--test", "basic"],
         "Running basic ML pipeline test"
     )
 